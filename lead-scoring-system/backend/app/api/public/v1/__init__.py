@@ -5,7 +5,7 @@ from __future__ import annotations
 from fastapi import APIRouter, FastAPI
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from . import leads, users
 
@@ -34,5 +34,5 @@ def public_api_docs():
 
 @docs_router.get("/openapi.json")
 def public_api_openapi():
-    return JSONResponse(_public_openapi_schema)
+    return ORJSONResponse(_public_openapi_schema)
 
@@ -7,7 +7,7 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import exists, func
 from sqlalchemy.orm import Session
 
 from ....database import get_db
@@ -98,8 +98,7 @@ async def create_lead(
 ) -> PublicLeadResponse:
     ensure_permissions(context, ["write_leads"])
 
-    existing = db.query(Lead).filter(Lead.email == payload.email).first()
-    if existing:
+    if db.query(exists().where(Lead.email == payload.email)).scalar():
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Lead with this email already exists")
 
     lead = Lead(
@@ -127,7 +127,7 @@ def update_api_key(
     return _serialize_api_key(api_key)
 
 
-@router.delete("/api-keys/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/api-keys/{key_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 def delete_api_key(
     key_id: int,
     db: Session = Depends(get_db),
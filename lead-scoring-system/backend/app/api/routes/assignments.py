@@ -142,7 +142,7 @@ def get_team_assignments(
     ]
 
 
-@router.delete("/{assignment_id}", status_code=204)
+@router.delete("/{assignment_id}", status_code=204, response_model=None)
 def unassign_lead(
     assignment_id: UUID,
     db: Session = Depends(get_db),
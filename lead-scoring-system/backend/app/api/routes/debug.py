@@ -1,7 +1,7 @@
 """Debug endpoints for troubleshooting."""
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.config import get_settings
 
 settings = get_settings()
@@ -13,7 +13,7 @@ def debug_cors(request: Request):
     """Debug CORS configuration."""
     origin = request.headers.get("origin")
     
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "request_origin": origin,
             "cors_origins": settings.cors_origins,
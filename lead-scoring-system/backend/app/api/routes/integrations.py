@@ -166,7 +166,7 @@ async def gmail_callback(
     return OAuthCallbackResponse(success=True, email_account=EmailAccountRead.model_validate(account))
 
 
-@router.post("/gmail/disconnect", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/gmail/disconnect", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 async def gmail_disconnect(
     current_user=Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -271,7 +271,7 @@ async def outlook_callback(
     return OAuthCallbackResponse(success=True, email_account=EmailAccountRead.model_validate(account))
 
 
-@router.post("/outlook/disconnect", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/outlook/disconnect", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 async def outlook_disconnect(
     current_user=Depends(get_current_active_user),
     db: Session = Depends(get_db),
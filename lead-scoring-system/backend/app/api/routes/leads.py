@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy import desc
+from sqlalchemy import desc, exists
 from sqlalchemy.orm import Session, joinedload
 
 from datetime import datetime
@@ -32,8 +32,7 @@ def create_lead(
 
     try:
         # Check if email already exists
-        existing_lead = db.query(Lead).filter(Lead.email == payload.email).first()
-        if existing_lead:
+        if db.query(exists().where(Lead.email == payload.email)).scalar():
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Lead with email {payload.email} already exists"
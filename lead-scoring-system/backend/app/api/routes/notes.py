@@ -78,7 +78,7 @@ def get_lead_notes(
     ]
 
 
-@router.delete("/{note_id}", status_code=204)
+@router.delete("/{note_id}", status_code=204, response_model=None)
 def delete_note(
     note_id: UUID,
     db: Session = Depends(get_db),
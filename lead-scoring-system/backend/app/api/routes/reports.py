@@ -399,7 +399,7 @@ def update_report(
     return ReportResponse.model_validate(report)
 
 
-@router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 def delete_report(
     report_id: int,
     db: Session = Depends(get_db),
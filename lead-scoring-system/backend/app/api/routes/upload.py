@@ -2,10 +2,12 @@
 
 import csv
 import io
-from typing import List
-from uuid import uuid4
+import logging
+from datetime import datetime
+from typing import List, Tuple
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
 from ...database import get_db
@@ -15,6 +17,7 @@ from ...schemas.lead import LeadCreate, LeadRead
 from ...services.ai_scoring import calculate_overall_score
 from ...services import auto_assign_lead
 from ...utils.auth import get_current_active_user
+from ...utils.ids import uuid7
 from ...utils.security import (
     validate_filename,
     validate_file_size,
@@ -23,11 +26,85 @@ from ...utils.security import (
     sanitize_csv_field,
     validate_csv_row_count,
     MAX_CSV_ROWS,
+    MAX_FILE_SIZE,
+    MAX_NAME_LENGTH,
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+_READ_CHUNK_SIZE = 64 * 1024
+
+_LEADS_COPY_SQL = (
+    "COPY leads (id, name, email, phone, source, location, created_by, "
+    "current_score, metadata, created_at, updated_at) FROM STDIN"
+)
+
+
+def _copy_leads(db: Session, new_leads: List[dict]) -> None:
+    """Stream ``new_leads`` into the leads table with a single PostgreSQL COPY."""
+    from psycopg.types.json import Jsonb
+
+    now = datetime.utcnow()
+    with db.connection().connection.cursor() as cursor:
+        with cursor.copy(_LEADS_COPY_SQL) as copy:
+            for lead in new_leads:
+                copy.write_row((
+                    lead["id"],
+                    lead["name"],
+                    lead["email"],
+                    lead["phone"],
+                    lead["source"],
+                    lead["location"],
+                    lead["created_by"],
+                    0,
+                    Jsonb(lead["_metadata"]),
+                    now,
+                    now,
+                ))
+
+
+def _insert_leads(db: Session, new_leads: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """Insert sanitized CSV rows and return ``(inserted, errors)``.
+
+    On PostgreSQL the batch is streamed with COPY, which skips per-statement
+    parsing/planning. COPY is all-or-nothing, so if any row is rejected the
+    batch is rolled back to a savepoint and retried one row at a time, keeping
+    the valid rows and reporting the failing ones like the per-row path does.
+    ``status`` is left to the column's ``'new'`` server default under COPY.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        try:
+            with db.begin_nested():
+                _copy_leads(db, new_leads)
+            return new_leads, []
+        except Exception:
+            # Fall through to the per-row path to find the bad rows
+            logger.warning("COPY of %d uploaded leads failed, retrying row by row", len(new_leads), exc_info=True)
+
+    inserted = []
+    errors = []
+    for lead in new_leads:
+        try:
+            with db.begin_nested():
+                db.add(Lead(
+                    **{key: value for key, value in lead.items() if key != "row"},
+                    current_score=0,
+                    classification=None,
+                    status=LeadStatus.NEW,
+                ))
+                db.flush()
+        except Exception as e:
+            errors.append({
+                "row": lead["row"],
+                "error": str(e)
+            })
+        else:
+            inserted.append(lead)
+    return inserted, errors
+
 
 @router.post("/csv", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def upload_csv_leads(
@@ -56,24 +133,33 @@ async def upload_csv_leads(
             detail="Invalid filename or file type. Only CSV files are allowed."
         )
     
-    # SECURITY: Check file size before reading
+    # SECURITY: Read in chunks and abort as soon as the size limit is exceeded
     file_size = 0
-    contents = b""
+    chunks = []
     try:
-        contents = await file.read()
-        file_size = len(contents)
-        
-        if not validate_file_size(file_size):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size exceeds maximum allowed size of 10MB"
-            )
+        while chunk := await file.read(_READ_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_FILE_SIZE:
+                break
+            chunks.append(chunk)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error reading file: {str(e)}"
         )
     
+    if file_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File size exceeds maximum allowed size of 10MB"
+        )
+    if not validate_file_size(file_size):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file is empty"
+        )
+    contents = b"".join(chunks)
+    
     try:
         # SECURITY: Validate encoding and decode safely
         try:
@@ -97,6 +183,8 @@ async def upload_csv_leads(
         
         created_leads = []
         errors = []
+        new_leads = []
+        seen_emails = set()
         
         # Process rows (already converted to list above)
         for row_num, row in enumerate(rows, start=2):  # Start at 2 (row 1 is header)
@@ -134,14 +222,14 @@ async def upload_csv_leads(
                     })
                     continue
                 
-                # SECURITY: Check if email already exists (after sanitization)
-                existing = db.query(Lead).filter(Lead.email == sanitized_email).first()
-                if existing:
+                # Duplicates within the same file are rejected like existing leads
+                if sanitized_email in seen_emails:
                     errors.append({
                         "row": row_num,
                         "error": f"Lead with email {sanitized_email} already exists"
                     })
                     continue
+                seen_emails.add(sanitized_email)
                 
                 # SECURITY: Sanitize optional fields
                 sanitized_phone = None
@@ -166,36 +254,66 @@ async def upload_csv_leads(
                     if not sanitized_location:
                         sanitized_location = None
                 
-                # Create lead with sanitized data
-                lead = Lead(
-                    id=uuid4(),
-                    name=sanitized_name,
-                    email=sanitized_email,
-                    phone=sanitized_phone,
-                    source=sanitized_source,
-                    location=sanitized_location,
-                    created_by=current_user.id,
-                    current_score=0,
-                    classification=None,
-                    status=LeadStatus.NEW,
-                    _metadata={
+                new_leads.append({
+                    "id": uuid7(),
+                    "name": sanitized_name,
+                    "email": sanitized_email,
+                    "phone": sanitized_phone,
+                    "source": sanitized_source,
+                    "location": sanitized_location,
+                    "created_by": current_user.id,
+                    "_metadata": {
                         "upload_source": "csv",
                         "uploaded_by": current_user.username,
                         "original_row": row_num
-                    }
-                )
-                
-                db.add(lead)
-                db.flush()
+                    },
+                    "row": row_num,
+                })
                 
-                # Score the lead with AI
+            except Exception as e:
+                errors.append({
+                    "row": row_num,
+                    "error": str(e)
+                })
+        
+        # SECURITY: Check which emails already exist (after sanitization) in one query
+        if new_leads:
+            existing_emails = {
+                email
+                for (email,) in db.query(Lead.email).filter(
+                    Lead.email.in_([lead["email"] for lead in new_leads])
+                )
+            }
+            if existing_emails:
+                for lead in new_leads:
+                    if lead["email"] in existing_emails:
+                        errors.append({
+                            "row": lead["row"],
+                            "error": f"Lead with email {lead['email']} already exists"
+                        })
+                new_leads = [lead for lead in new_leads if lead["email"] not in existing_emails]
+                errors.sort(key=lambda error: error["row"])
+        
+        if new_leads:
+            new_leads, insert_errors = _insert_leads(db, new_leads)
+            if insert_errors:
+                errors.extend(insert_errors)
+                errors.sort(key=lambda error: error["row"])
+            
+            # Score the leads with AI
+            for lead in new_leads:
                 try:
-                    calculate_overall_score(lead.id, db, use_openai=True)
-                except Exception as e:
+                    calculate_overall_score(lead["id"], db, use_openai=True)
+                except Exception:
                     # Continue even if scoring fails
-                    pass
-                
-                db.refresh(lead)
+                    logger.warning("Scoring uploaded lead %s failed", lead["id"], exc_info=True)
+            
+            scored = {
+                lead.id: lead
+                for lead in db.query(Lead).filter(Lead.id.in_([lead["id"] for lead in new_leads]))
+            }
+            for new_lead in new_leads:
+                lead = scored[new_lead["id"]]
                 created_leads.append({
                     "id": str(lead.id),
                     "name": lead.name,
@@ -203,12 +321,6 @@ async def upload_csv_leads(
                     "score": lead.current_score,
                     "classification": lead.classification
                 })
-                
-            except Exception as e:
-                errors.append({
-                    "row": row_num,
-                    "error": str(e)
-                })
         
         db.commit()
         
@@ -247,8 +359,7 @@ def create_individual_lead(
             )
         
         # Check if email already exists
-        existing_lead = db.query(Lead).filter(Lead.email == sanitized_email).first()
-        if existing_lead:
+        if db.query(exists().where(Lead.email == sanitized_email)).scalar():
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Lead with email {sanitized_email} already exists"
@@ -292,7 +403,7 @@ def create_individual_lead(
 
         # Create new lead with ownership and sanitized data
         lead = Lead(
-            id=uuid4(),
+            id=uuid7(),
             name=sanitized_name,
             email=sanitized_email,
             phone=sanitized_phone,
@@ -113,7 +113,7 @@ def update_webhook(
     return _serialize_webhook(webhook)
 
 
-@router.delete("/webhooks/{webhook_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/webhooks/{webhook_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 def delete_webhook(
     webhook_id: int,
     db: Session = Depends(get_db),
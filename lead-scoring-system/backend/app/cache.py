@@ -9,7 +9,7 @@ from app.config import get_settings
 settings = get_settings()
 
 redis_client = redis.from_url(
-    settings.redis_url,
+    str(settings.redis_url),
     decode_responses=True,
 )
 
@@ -2,21 +2,47 @@
 
 import os
 import json
-from functools import lru_cache
+import re
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import PostgresDsn, RedisDsn
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def _json_loads(value: str):
+    """Decode JSON with orjson when available, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+_ENV_FILE = BASE_DIR.parent / ".env"
+
+# Railway may expose the Postgres URL under any of these names, in priority order
+DATABASE_URL_ENV_KEYS = ("DATABASE_URL", "POSTGRES_URL", "PGDATABASE", "POSTGRES_DATABASE_URL")
+
+# Railway hands out postgres:// or postgresql://; SQLAlchemy needs the psycopg driver
+_POSTGRES_SCHEME_RE = re.compile(r"^postgres(?:ql)?://")
 
 
 class Settings(BaseSettings):
     """Application settings pulled from environment variables."""
 
+    model_config = SettingsConfigDict(
+        env_file=_ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+    )
+
     app_name: str = Field("Lead Scoring System")
     environment: str = Field(default="development")
     
@@ -49,9 +75,13 @@ class Settings(BaseSettings):
         validation_alias="DATABASE_URL",  # Pydantic alias to read from DATABASE_URL env var
     )
 
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Get database URL, handling Railway's postgres:// format."""
+        """Get database URL, handling Railway's postgres:// format.
+
+        Resolved once per Settings instance; the environment does not change
+        after startup, so repeated accesses reuse the first result.
+        """
         import logging
         logger = logging.getLogger(__name__)
         
@@ -63,16 +93,19 @@ class Settings(BaseSettings):
         logger.info(f"   Type of database_url_str: {type(self.database_url_str)}")
         
         # Try multiple sources (Railway might use different env var names)
-        url = (
-            os.getenv("DATABASE_URL") or
-            os.getenv("POSTGRES_URL") or
-            os.getenv("PGDATABASE") or
-            os.getenv("POSTGRES_DATABASE_URL") or
-            (self.database_url_str if self.database_url_str else None)
-        )
+        url = None
+        source = "unknown source"
+        for key in DATABASE_URL_ENV_KEYS:
+            value = os.environ.get(key)
+            if value:
+                url, source = value, f"{key} env var"
+                break
+        else:
+            if self.database_url_str:
+                url, source = self.database_url_str, "database_url_str field"
         
         if url:
-            logger.info(f"   Found URL from: {self._get_url_source(url)}")
+            logger.info(f"   Found URL from: {source}")
             logger.info(f"   URL length: {len(url)}")
             logger.info(f"   URL starts with: {url[:20]}..." if len(url) > 20 else f"   URL: {url}")
         else:
@@ -98,35 +131,12 @@ class Settings(BaseSettings):
             logger.info(f"✅ DATABASE_URL found (length: {len(url)})")
         
         # Railway provides postgres:// but SQLAlchemy needs postgresql://
-        original_url = url
-        if url.startswith("postgres://"):
-            url = url.replace("postgres://", "postgresql+psycopg://", 1)
-            logger.info("   Converted postgres:// to postgresql+psycopg://")
-        elif url.startswith("postgresql://"):
-            # Ensure we use psycopg driver
-            if "+psycopg" not in url:
-                url = url.replace("postgresql://", "postgresql+psycopg://", 1)
-                logger.info("   Added psycopg driver to postgresql://")
-        
-        if original_url != url:
+        url, rewritten = _POSTGRES_SCHEME_RE.subn("postgresql+psycopg://", url, count=1)
+        if rewritten:
+            logger.info("   Rewrote scheme to postgresql+psycopg://")
             logger.info(f"   Final URL format: {url[:30]}..." if len(url) > 30 else f"   Final URL: {url}")
         
         return url
-    
-    def _get_url_source(self, url: str) -> str:
-        """Determine which source provided the URL."""
-        if os.getenv("DATABASE_URL") == url:
-            return "DATABASE_URL env var"
-        elif os.getenv("POSTGRES_URL") == url:
-            return "POSTGRES_URL env var"
-        elif os.getenv("PGDATABASE") == url:
-            return "PGDATABASE env var"
-        elif os.getenv("POSTGRES_DATABASE_URL") == url:
-            return "POSTGRES_DATABASE_URL env var"
-        elif self.database_url_str == url:
-            return "database_url_str field"
-        else:
-            return "unknown source"
 
     redis_url: RedisDsn = Field(
         default="redis://localhost:6379/0",
@@ -137,23 +147,35 @@ class Settings(BaseSettings):
         default="http://localhost:5173",
         description="Comma-separated list of allowed CORS origins.",
     )
+    # Chromium clamps Access-Control-Max-Age to 7200s (2h) and Firefox to 86400s (24h);
+    # sending the Firefox ceiling gets every browser its own maximum preflight cache.
+    cors_max_age: int = Field(
+        default=86400,
+        description="Seconds browsers may cache a CORS preflight (Access-Control-Max-Age).",
+        validation_alias="CORS_MAX_AGE",
+    )
 
-    @property
-    def cors_origins(self) -> List[str]:
-        """Parse ALLOWED_ORIGINS from environment (Railway compatible)."""
+    @cached_property
+    def cors_origins(self) -> Tuple[str, ...]:
+        """Parse ALLOWED_ORIGINS from environment (Railway compatible).
+
+        Parsed once per Settings instance into an immutable tuple.
+        """
         origins_str = os.getenv("ALLOWED_ORIGINS", self.cors_origins_str)
         if not origins_str:
-            return ["http://localhost:5173"]
+            return ("http://localhost:5173",)
         
         # Handle both comma-separated string and JSON array
         if origins_str.startswith("["):
             try:
-                return json.loads(origins_str)
-            except json.JSONDecodeError:
-                pass
+                origins = _json_loads(origins_str)
+            except ValueError:
+                origins = None
+            if isinstance(origins, list) and all(isinstance(origin, str) for origin in origins):
+                return tuple(origins)
         
         # Split comma-separated values
-        return [origin.strip() for origin in origins_str.split(",") if origin.strip()]
+        return tuple(filter(None, map(str.strip, origins_str.split(","))))
 
     # Security
     secret_key: str = Field(
@@ -181,29 +203,29 @@ class Settings(BaseSettings):
 
     # Railway-specific
     railway_environment: Optional[str] = Field(
-        default=None, description="Railway environment name."
+        default=None, description="Railway environment name.", validation_alias="RAILWAY_ENVIRONMENT"
     )
     railway_project_id: Optional[str] = Field(
-        default=None, description="Railway project ID."
+        default=None, description="Railway project ID.", validation_alias="RAILWAY_PROJECT_ID"
     )
-    port: int = Field(default=8000, description="Server port (Railway sets $PORT).")
+    port: int = Field(default=8000, description="Server port (Railway sets $PORT).", validation_alias="PORT")
 
-    class Config:
-        env_file = BASE_DIR.parent / ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Get Railway environment variables
-        self.railway_environment = os.getenv("RAILWAY_ENVIRONMENT")
-        self.railway_project_id = os.getenv("RAILWAY_PROJECT_ID")
-        self.port = int(os.getenv("PORT", "8000"))
+    # Health endpoints
+    health_cache_ttl: float = Field(
+        default=5.0,
+        description="Seconds a health snapshot is served before a background refresh.",
+        validation_alias="HEALTH_CACHE_TTL",
+    )
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_settings() -> Settings:
-    """Return a cached instance of application settings."""
+    """Return a cached instance of application settings.
+
+    The test suite's ``clear_settings_cache`` fixture calls
+    ``get_settings.cache_clear()`` around every test, so environment changes
+    made with ``monkeypatch`` are picked up on the next call.
+    """
 
     return Settings()  # type: ignore[call-arg]
 
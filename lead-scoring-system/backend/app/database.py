@@ -1,12 +1,18 @@
 """Database configuration and session management."""
 
+import asyncio
+import ipaddress
 import logging
-from typing import Generator
+import re
+import socket
+from functools import lru_cache
+from typing import Generator, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.orm import declarative_base, sessionmaker
 
-from .config import get_settings
+from .config import Settings, get_settings
 from .utils.sqlalchemy_compat import apply_sqlalchemy_typing_compat
 
 apply_sqlalchemy_typing_compat()
@@ -15,57 +21,173 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Use the property that handles postgres:// to postgresql:// conversion
+# Resolved once by Settings; reused by build_engine() and the debug endpoints
 DATABASE_URL = settings.database_url
 
 # Log database URL (masked for security)
+# scheme://<credentials>@<host...>, with exactly one "@" in the URL
+_MASK_RE = re.compile(r"^([^@]*?)://[^@]*@([^@]*)$")
+
+
+@lru_cache(maxsize=4)
 def mask_url(url: str) -> str:
     """Mask sensitive parts of database URL for logging."""
-    if "@" in url:
-        parts = url.split("@")
-        if len(parts) == 2:
-            auth = parts[0]
-            host = parts[1]
-            if "://" in auth:
-                scheme = auth.split("://")[0]
-                masked = f"{scheme}://***:***@{host}"
-                return masked
+    match = _MASK_RE.match(url)
+    if match:
+        return f"{match.group(1)}://***:***@{match.group(2)}"
     return url
 
-logger.info(f"Connecting to database (Railway: {settings.railway_environment or 'local'})")
-logger.info(f"Database URL: {mask_url(DATABASE_URL)}")
-
-# Check if using default localhost URL (indicates DATABASE_URL not set)
-if "localhost:5433" in DATABASE_URL or "127.0.0.1:5433" in DATABASE_URL:
-    logger.warning("⚠️  Using default localhost database URL - DATABASE_URL environment variable may not be set!")
-    logger.warning("⚠️  Please ensure PostgreSQL service is connected to backend service in Railway")
-
-# Create engine with Railway-optimized settings for high capacity
-# Increased pool sizes for better load handling
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,
-    future=True,
-    pool_pre_ping=True,        # Verify connections before using (prevents stale connections)
-    pool_recycle=3600,         # Recycle connections after 1 hour (prevents timeout errors)
-    pool_size=20,              # Increased base pool size for higher capacity (was 10)
-    max_overflow=40,           # Increased overflow for burst traffic (was 20)
-    pool_timeout=30,           # Timeout waiting for connection from pool (seconds)
-    connect_args={
-        "connect_timeout": 10,  # Connection timeout (seconds)
-        # TCP keepalive settings for psycopg3
-        # These help maintain stable connections in cloud environments
-    },
-    # Add query timeout to prevent long-running queries from blocking
-    execution_options={
-        "autocommit": False,
-        "isolation_level": "READ COMMITTED",  # Lower isolation for better concurrency
+
+def is_default_local_url(url: str) -> bool:
+    """True for the localhost:5433 fallback used when DATABASE_URL is not set."""
+    return "localhost:5433" in url or "127.0.0.1:5433" in url
+
+
+# DATABASE_URL never changes after boot, so mask and classify it once for every log/debug site
+MASKED_DATABASE_URL = mask_url(DATABASE_URL)
+IS_DEFAULT_LOCAL_DATABASE = is_default_local_url(DATABASE_URL)
+
+
+def build_engine(settings: Settings) -> Engine:
+    """Create the application engine from already-resolved settings."""
+    database_url = settings.database_url
+
+    logger.info(f"Connecting to database (Railway: {settings.railway_environment or 'local'})")
+    logger.info(f"Database URL: {mask_url(database_url)}")
+
+    # Check if using default localhost URL (indicates DATABASE_URL not set)
+    if is_default_local_url(database_url):
+        logger.warning("⚠️  Using default localhost database URL - DATABASE_URL environment variable may not be set!")
+        logger.warning("⚠️  Please ensure PostgreSQL service is connected to backend service in Railway")
+
+    # Create engine with Railway-optimized settings for high capacity
+    # Increased pool sizes for better load handling
+    return create_engine(
+        database_url,
+        echo=False,
+        future=True,
+        pool_pre_ping=True,        # Verify connections before using (prevents stale connections)
+        pool_recycle=3600,         # Recycle connections after 1 hour (prevents timeout errors)
+        pool_size=20,              # Increased base pool size for higher capacity (was 10)
+        max_overflow=40,           # Increased overflow for burst traffic (was 20)
+        pool_timeout=30,           # Timeout waiting for connection from pool (seconds)
+        pool_use_lifo=True,        # Reuse the most recently returned (warmest) connection first
+        connect_args={
+            "connect_timeout": 10,  # Connection timeout (seconds)
+            # TCP keepalive settings for psycopg3
+            # These help maintain stable connections in cloud environments
+        },
+        # Add query timeout to prevent long-running queries from blocking
+        execution_options={
+            "autocommit": False,
+            "isolation_level": "READ COMMITTED",  # Lower isolation for better concurrency
+        }
+    )
+
+
+engine = build_engine(settings)
+
+
+# Resolved addresses of the database host, pinned for new connections. Every
+# A/AAAA record is kept, in resolver order, so libpq can still fail over
+# between them; it connects to each ``hostaddr`` and uses ``host`` for TLS.
+_pinned_hostaddrs: Tuple[str, ...] = ()
+
+
+async def resolve_database_host(url: str = DATABASE_URL) -> Tuple[str, ...]:
+    """Resolve the database hostname on the event loop and pin it for new connections.
+
+    Returns the pinned addresses, or ``()`` for IP literals, socket paths and
+    multi-host URLs. A lookup failure clears the pin so libpq falls back to
+    its own resolution.
+    """
+    global _pinned_hostaddrs
+    parsed = make_url(url)
+    host = parsed.host
+    if not host or host.startswith("/") or "," in host or _is_ip_address(host):
+        _pinned_hostaddrs = ()
+        return ()
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, parsed.port or 5432, type=socket.SOCK_STREAM
+        )
+    except OSError:
+        _pinned_hostaddrs = ()
+        raise
+    _pinned_hostaddrs = tuple(dict.fromkeys(info[4][0] for info in infos))
+    return _pinned_hostaddrs
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+@event.listens_for(engine, "do_connect")
+def _use_pinned_hostaddr(dialect, conn_rec, cargs, cparams) -> None:
+    addrs = _pinned_hostaddrs
+    if addrs and "hostaddr" not in cparams and cparams.get("host"):
+        # libpq pairs the lists entry by entry, so repeat the name once per address
+        cparams["host"] = ",".join([cparams["host"]] * len(addrs))
+        cparams["hostaddr"] = ",".join(addrs)
+
+
+def _open_warm_connection(bind: Engine) -> Connection:
+    conn = bind.connect()
+    try:
+        conn.execute(text("SELECT 1"))
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+async def warm_up_pool(bind: Engine) -> int:
+    """Open ``pool_size`` connections concurrently so early requests skip the connect.
+
+    Each connect (DNS, TLS, auth) runs in its own worker thread, so warm-up
+    takes about one connect round-trip instead of ``pool_size`` of them.
+    Connections are held together before being returned, otherwise the pool
+    would hand the same connection back for every ``SELECT 1``.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_open_warm_connection, bind) for _ in range(bind.pool.size())),
+        return_exceptions=True,
+    )
+    connections = [conn for conn in results if isinstance(conn, Connection)]
+    for conn in connections:
+        conn.close()
+    errors = [exc for exc in results if isinstance(exc, BaseException)]
+    if errors:
+        raise errors[0]
+    return len(connections)
+
+
+def pool_stats(bind: Engine) -> dict:
+    """Return the pool counters, taking the queue's lock only once.
+
+    ``QueuePool.checkedout()`` is ``size - checkedin + overflow`` and would
+    lock the queue again, so it is derived from the single ``checkedin()`` read.
+    """
+    pool = bind.pool
+    size = pool.size()
+    checked_in = pool.checkedin()
+    overflow = pool.overflow()
+    return {
+        "size": size,
+        "checked_in": checked_in,
+        "checked_out": size - checked_in + overflow,
+        "overflow": overflow,
+        "max_overflow": getattr(pool, "_max_overflow", 0),
     }
-)
 
-SessionLocal = scoped_session(
-    sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
-)
+
+# Plain factory: get_db() already scopes one session per request, so a
+# thread-local registry would only add lookups and leak across async handlers
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
 Base = declarative_base()
 
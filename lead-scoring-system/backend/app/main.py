@@ -1,114 +1,156 @@
 """FastAPI application entry point for the lead scoring backend."""
 
+import asyncio
 import os
-from datetime import datetime
+import re
+import socket
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 import logging
+import time
+from typing import Optional
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .api import router as api_router
 from .cache import redis_client
-from .config import get_settings
-from .middleware.circuit_breaker import CircuitBreakerMiddleware
-from .middleware.connection_pool_monitor import ConnectionPoolMonitor
-from .middleware.cors_fix import CORSFixMiddleware
+from .config import DATABASE_URL_ENV_KEYS, get_settings
+from .database import (
+    DATABASE_URL,
+    IS_DEFAULT_LOCAL_DATABASE,
+    MASKED_DATABASE_URL,
+    engine,
+    pool_stats,
+    resolve_database_host,
+    warm_up_pool,
+)
+from .middleware.combined import CombinedHotPathMiddleware
+from .middleware.cors_preflight_asgi import CORSPreflightASGI
 from .middleware.error_handler import (
     database_exception_handler,
     global_exception_handler,
     http_exception_handler,
     validation_exception_handler,
 )
-from .middleware.rate_limit import configure_rate_limiting
-from .middleware.request_limits import RequestLimitsMiddleware
-from .middleware.request_validation import RequestValidationMiddleware
-from .middleware.security_headers import SecurityHeadersMiddleware
-from .tasks.crm_scheduler import start_crm_sync_scheduler
-from .tasks.email_scheduler import start_email_sync_scheduler
 from .utils.logger import setup_logging
+from .utils.routing import install_static_route_dispatcher
+
+try:
+    # uvicorn already picks uvloop when installed; this covers other entrypoints
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:  # pragma: no cover - uvloop is not available on Windows
+    pass
 
 settings = get_settings()
 
+# Settings never change after boot; read them once instead of on every request
+APP_NAME = settings.app_name
+ENVIRONMENT_NAME = settings.railway_environment or settings.environment
+# Deployed (production env or any Railway environment) as opposed to local development
+IS_PRODUCTION = settings.environment == "production" or bool(settings.railway_environment)
+
 # Initialize logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """Bind the port immediately and finish slow startup work in the background.
+
+    The email and CRM sync schedulers run for the lifetime of the app and are
+    stopped before the database engine is disposed.
+    """
+    # The schedulers pull in the CRM and email service clients; import them
+    # here so importing app.main stays cheap for tooling and workers
+    from .tasks.crm_scheduler import crm_sync_scheduler
+    from .tasks.email_scheduler import email_sync_scheduler
+
+    application.state.ready = False
+    application.state.db_ok = None
+    application.state.db_error = None
+    init_task = asyncio.create_task(_deferred_init(application))
+    probe_task = asyncio.create_task(_database_probe_loop(application))
+    try:
+        async with email_sync_scheduler(), crm_sync_scheduler():
+            yield
+    finally:
+        for task in (init_task, probe_task):
+            if not task.done():
+                task.cancel()
+        engine.dispose()
+
+
 # Always enable docs, even in production (for Railway deployment)
 # If you want to disable in production, set docs_url=None conditionally
 app = FastAPI(
-    title=settings.app_name,
+    title=APP_NAME,
     version="2.0.0",
     debug=settings.environment == "development",
     docs_url="/docs",  # Explicitly enable Swagger UI
     redoc_url="/redoc",  # Explicitly enable ReDoc
-    openapi_url="/openapi.json"  # Explicitly enable OpenAPI schema
+    openapi_url="/openapi.json",  # Explicitly enable OpenAPI schema
+    default_response_class=ORJSONResponse,  # orjson encoder for every route by default
+    lifespan=lifespan,
 )
 
-# Configure rate limiting (optional - can be disabled in development)
-try:
-    if settings.environment == "production":
-        configure_rate_limiting(app)
-except Exception:
-    # Rate limiting is optional, continue if it fails
-    pass
-
+# Static CORS configuration, built once at import and shared by the middleware and logs
+CORS_ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD")
+CORS_ALLOW_HEADERS = ("*",)
+CORS_EXPOSE_HEADERS = ("*",)
+CORS_ORIGIN_REGEX = r"https://.*\.up\.railway\.app|https://.*\.railway\.app|https?://(?:[\w-]+\.)?ventrix\.tech"
+_CORS_ORIGIN_RE = re.compile(CORS_ORIGIN_REGEX)
+RAILWAY_FRONTEND_DOMAINS = (
+    "https://frontend-production-e9b2.up.railway.app",
+    "https://cursor-ai-lead-scoring-system-v10-production-8d7f.up.railway.app",
+    "https://ventrix.tech",  # Production domain
+    "http://ventrix.tech",  # Allow HTTP for redirects
+    "https://www.ventrix.tech",
+    "http://www.ventrix.tech",
+    "https://app.ventrix.tech",
+    "http://app.ventrix.tech",
+)
 
-# Store CORS origins globally for OPTIONS handler
-_cors_allow_origins = []
+def configure_cors(application: FastAPI) -> frozenset:
+    """Configure CORS based on environment - ALWAYS allows Railway frontend domains.
 
-def configure_cors(application: FastAPI) -> None:
-    """Configure CORS based on environment - ALWAYS allows Railway frontend domains."""
-    global _cors_allow_origins
+    Returns the allowed origins as a frozenset for the preflight middleware.
+    """
 
-    # Start with settings or defaults
-    allow_origins = list(settings.cors_origins) if settings.cors_origins else []
-    
-    # CRITICAL: Always add Railway frontend domain explicitly
-    railway_frontend_domains = [
-        "https://frontend-production-e9b2.up.railway.app",
-        "https://cursor-ai-lead-scoring-system-v10-production-8d7f.up.railway.app",
-        "https://ventrix.tech",  # Production domain
-        "http://ventrix.tech",  # Allow HTTP for redirects
-        "https://www.ventrix.tech",
-        "http://www.ventrix.tech",
-        "https://app.ventrix.tech",
-        "http://app.ventrix.tech",
-    ]
+    # Ordered set: settings first, then the Railway frontend domains, no duplicates
+    seen = dict.fromkeys(settings.cors_origins)
+    seen.update(dict.fromkeys(RAILWAY_FRONTEND_DOMAINS))
     
     # Add from environment if available
     railway_frontend = os.getenv("RAILWAY_PUBLIC_DOMAIN") or os.getenv("FRONTEND_URL")
     if railway_frontend:
         if not railway_frontend.startswith("http"):
             railway_frontend = f"https://{railway_frontend}"
-        if railway_frontend not in railway_frontend_domains:
-            railway_frontend_domains.append(railway_frontend)
-    
-    # Always add Railway frontend domains (remove wildcards and duplicates)
-    for domain in railway_frontend_domains:
-        if domain not in allow_origins:
-            allow_origins.append(domain)
+        seen[railway_frontend] = None
     
-    # Remove wildcards in production
-    if settings.environment == "production" or settings.railway_environment:
-        allow_origins = [origin for origin in allow_origins if origin != "*"]
+    # Remove wildcards in production so CORSMiddleware only matches the concrete
+    # list/regex instead of echoing any request Origin alongside credentials
+    if IS_PRODUCTION:
+        seen.pop("*", None)
     
     # Add localhost for development
     if settings.environment != "production":
-        if "http://localhost:5173" not in allow_origins:
-            allow_origins.append("http://localhost:5173")
+        seen["http://localhost:5173"] = None
+    allow_origins = list(seen)
     
-    # Store globally for OPTIONS handler
-    _cors_allow_origins = allow_origins.copy()
-    
-    logger.info(f"🌐 CORS Configuration:")
-    logger.info(f"   Allowed origins: {allow_origins}")
     logger.info(
-        "   Regex pattern: https://.*\\.up\\.railway\\.app|https://.*\\.railway\\.app|https?://(?:[\\w-]+\\.)?ventrix\\.tech"
+        "🌐 CORS Configuration:\n   Allowed origins: %s\n   Regex pattern: %s",
+        allow_origins,
+        CORS_ORIGIN_REGEX,
     )
     
     # Use FastAPI's built-in CORS middleware
@@ -117,44 +159,41 @@ def configure_cors(application: FastAPI) -> None:
     application.add_middleware(
         CORSMiddleware,
         allow_origins=allow_origins if allow_origins else ["*"],  # Explicit origins (fallback to all in dev)
-        allow_origin_regex=r"https://.*\.up\.railway\.app|https://.*\.railway\.app|https?://(?:[\w-]+\.)?ventrix\.tech",  # Allow ALL Railway domains and ventrix.tech via regex
+        allow_origin_regex=CORS_ORIGIN_REGEX,  # Allow ALL Railway domains and ventrix.tech via regex
         allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD"],
-        allow_headers=["*"],
-        expose_headers=["*"],
-        max_age=3600,  # Cache preflight for 1 hour
+        allow_methods=CORS_ALLOW_METHODS,
+        allow_headers=CORS_ALLOW_HEADERS,
+        expose_headers=CORS_EXPOSE_HEADERS,
+        max_age=settings.cors_max_age,  # Let browsers cache preflights (CORS_MAX_AGE, default 24h)
     )
     
     logger.info("✅ CORS middleware configured and added to application")
+    return frozenset(seen)
+
+
+def index_routes_by_segment(routes) -> dict:
+    """Group routes under every ``/segment`` of their path, e.g. ``"/auth"`` or ``"/login"``."""
+    index: dict = {}
+    for route in routes:
+        path = getattr(route, "path", None)
+        if path is None:
+            continue
+        for segment in {f"/{part}" for part in path.split("/") if part}:
+            index.setdefault(segment, []).append(route)
+    return index
 
 
 def configure_routers(application: FastAPI) -> None:
     """Attach API routers to the application instance."""
 
     @application.get("/api")
-    def api_info():
+    async def api_info():
         """API information endpoint."""
-        return {
-            "message": "Lead Scoring System API",
-            "version": "2.0.0",
-            "endpoints": {
-                "authentication": "/api/auth",
-                "leads": "/api/leads",
-                "assignments": "/api/assignments",
-                "notes": "/api/notes",
-                "notifications": "/api/notifications",
-                "health": "/health",
-                "docs": "/docs",
-                "openapi": "/openapi.json"
-            },
-            "base_path": "/api"
-        }
+        return Response(content=_API_INFO_BODY, media_type="application/json")
 
     @application.get("/api/config")
     def frontend_config(request: Request):
         """Frontend configuration endpoint - provides API base URL."""
-        import os
-        
         # Get backend URL from request (most reliable)
         scheme = request.url.scheme
         host = request.url.hostname
@@ -168,70 +207,67 @@ def configure_routers(application: FastAPI) -> None:
         
         api_base_url = f"{backend_base}/api"
         
-        # Get CORS origins for debugging
-        cors_origins = settings.cors_origins
-        
         return {
             "apiBaseUrl": api_base_url,
-            "environment": settings.railway_environment or settings.environment,
-            "corsOrigins": cors_origins,
+            "environment": ENVIRONMENT_NAME,
+            "corsOrigins": settings.cors_origins,  # Parsed once at startup, for debugging
             "frontendOrigin": request.headers.get("origin"),
         }
     
-    @application.options("/api/{path:path}")
-    async def options_handler(request: Request, path: str):
-        """Explicit OPTIONS handler for CORS preflight."""
-        import re
-        origin = request.headers.get("origin")
-        logger.info(f"🔍 OPTIONS preflight for /api/{path} from origin: {origin}")
-        
-        # Check if origin is allowed (same logic as CORS middleware)
-        allowed_origin = None
-        if origin:
-            # Check against explicit origins (use global variable)
-            if origin in _cors_allow_origins:
-                allowed_origin = origin
-                logger.info(f"✅ Origin allowed (explicit): {origin}")
-            # Check against regex pattern for Railway and ventrix.tech
-            elif re.match(r"https://.*\.up\.railway\.app|https://.*\.railway\.app|https?://(?:[\w-]+\.)?ventrix\.tech", origin):
-                allowed_origin = origin
-                logger.info(f"✅ Origin allowed (regex): {origin}")
-            else:
-                logger.warning(f"⚠️  Origin not allowed: {origin}")
-        
-        # Use origin if allowed, otherwise use * (for development)
-        cors_origin = allowed_origin if allowed_origin else (origin if origin else "*")
-        
-        logger.info(f"📤 Sending CORS headers with origin: {cors_origin}")
-        
-        return JSONResponse(
-            content={"message": "CORS preflight"},
-            headers={
-                "Access-Control-Allow-Origin": cors_origin,
-                "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD",
-                "Access-Control-Allow-Headers": "*",
-                "Access-Control-Allow-Credentials": "true",
-                "Access-Control-Max-Age": "3600",
-            }
-        )
-
     application.include_router(api_router, prefix="/api")
-
-
-@app.get("/")
-def root():
-    """Root endpoint."""
-    return {
-        "message": f"{settings.app_name} v2.0",
-        "status": "operational",
-        "environment": settings.railway_environment or settings.environment
-    }
+    application.state.routes_by_segment = index_routes_by_segment(application.routes)
+
+
+# Bodies that never change after boot are encoded once instead of per request
+_ROOT_BODY = orjson.dumps({
+    "message": f"{APP_NAME} v2.0",
+    "status": "operational",
+    "environment": ENVIRONMENT_NAME
+})
+_TEST_BODY = orjson.dumps({"message": "Test endpoint works!", "status": "ok"})
+_API_INFO_BODY = orjson.dumps({
+    "message": "Lead Scoring System API",
+    "version": "2.0.0",
+    "endpoints": {
+        "authentication": "/api/auth",
+        "leads": "/api/leads",
+        "assignments": "/api/assignments",
+        "notes": "/api/notes",
+        "notifications": "/api/notifications",
+        "health": "/health",
+        "docs": "/docs",
+        "openapi": "/openapi.json"
+    },
+    "base_path": "/api"
+})
+
+
+class StaticJSONEndpoint:
+    """ASGI endpoint replaying a pre-encoded JSON body.
+
+    Starlette mounts non-function endpoints as raw ASGI apps, so these routes
+    skip FastAPI's request parsing, dependency resolution and serialization.
+    """
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+# Root endpoint
+app.add_route("/", StaticJSONEndpoint(_ROOT_BODY), methods=["GET"], include_in_schema=False)
 
 
 def check_database() -> str:
     """Return database connectivity status."""
     try:
-        from app.database import engine
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
         return "connected"
@@ -250,34 +286,28 @@ def check_redis() -> str:
         return "disconnected"
 
 
-def collect_health_data() -> dict:
-    """Gather current metrics about system health."""
-    data: dict = {
-        "status": "healthy",
-        "environment": settings.railway_environment or settings.environment,
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+# Health fields fixed at boot; only live metrics are filled in per call
+_STATIC_HEALTH = {"status": "healthy", "environment": ENVIRONMENT_NAME}
 
-    try:
-        from app.database import engine
 
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+def collect_health_data() -> dict:
+    """Gather current metrics about system health."""
+    data: dict = {**_STATIC_HEALTH, "timestamp": datetime.now(timezone.utc).isoformat()}
 
-        pool = engine.pool
-        data["database"] = {
-            "status": "connected",
-            "pool": {
-                "size": getattr(pool, "size", lambda: 0)(),
-                "checked_in": getattr(pool, "checkedin", lambda: 0)(),
-                "checked_out": getattr(pool, "checkedout", lambda: 0)(),
-                "overflow": getattr(pool, "overflow", lambda: 0)(),
-                "max_overflow": getattr(pool, "_max_overflow", 0),
-            },
-        }
-    except Exception as exc:  # pragma: no cover - relies on environment
-        data["database"] = {"status": "disconnected", "error": str(exc)}
+    # The round-trip runs in _database_probe_loop; pool counters are in-process reads
+    db_ok = getattr(app.state, "db_ok", None)
+    if db_ok is False:
+        data["database"] = {"status": "disconnected", "error": app.state.db_error}
         data["status"] = "degraded"
+    else:
+        try:
+            data["database"] = {
+                "status": "connected" if db_ok else "checking",
+                "pool": pool_stats(engine),
+            }
+        except Exception as exc:  # pragma: no cover - relies on environment
+            data["database"] = {"status": "disconnected", "error": str(exc)}
+            data["status"] = "degraded"
 
     try:
         info = redis_client.info()
@@ -295,15 +325,66 @@ def collect_health_data() -> dict:
     return data
 
 
+# Railway probes and the dashboard poll share one snapshot refreshed at most once per TTL
+HEALTH_CACHE_TTL = settings.health_cache_ttl
+_health_snapshot: tuple = (0.0, None, b"")  # (monotonic time taken, data, encoded data)
+_health_refresh: Optional[asyncio.Task] = None
+
+
+async def _refresh_health_snapshot() -> tuple:
+    global _health_snapshot
+    data = await run_in_threadpool(collect_health_data)
+    body = orjson.dumps(data)
+    _health_snapshot = (time.monotonic(), data, body)
+    return data, body
+
+
+async def get_health_snapshot() -> tuple:
+    """Return ``(data, json_bytes)`` for the latest health check, refreshing if stale.
+
+    Concurrent callers share a single in-flight refresh; once a snapshot exists
+    they get the stale copy instead of waiting for the refresh to finish.
+    """
+    global _health_refresh
+    taken_at, data, body = _health_snapshot
+    if data is not None and time.monotonic() - taken_at < HEALTH_CACHE_TTL:
+        return data, body
+
+    refresh = _health_refresh
+    if refresh is None or refresh.done():
+        refresh = _health_refresh = asyncio.create_task(_refresh_health_snapshot())
+    if data is not None:
+        return data, body
+    return await asyncio.shield(refresh)
+
+
 @app.get("/health", response_class=HTMLResponse)
-def health_dashboard():
-    data = collect_health_data()
-    return HTMLResponse(content=render_health_dashboard(data))
+async def health_dashboard():
+    _, body = await get_health_snapshot()
+    return HTMLResponse(content=health_dashboard_bytes(body))
+
+
+@app.get("/health/live")
+def health_live():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "live"}
+
+
+@app.get("/health/ready")
+def health_ready(request: Request):
+    """Readiness probe: 503 until the deferred startup checks have finished."""
+    if not getattr(request.app.state, "ready", False):
+        return ORJSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
+
+
+_NO_STORE = {"Cache-Control": "no-store"}
 
 
 @app.get("/health.json")
-def health_json():
-    return JSONResponse(content=collect_health_data())
+async def health_json():
+    _, body = await get_health_snapshot()
+    return Response(content=body, media_type="application/json", headers=_NO_STORE)
 
 
 def generate_health_dashboard(health_data: dict) -> str:
@@ -311,31 +392,17 @@ def generate_health_dashboard(health_data: dict) -> str:
     return render_health_dashboard(health_data)
 
 
-def render_health_dashboard(health_data: dict) -> str:
-    """Render the refreshed health dashboard."""
-    status = (health_data.get("status") or "unknown").upper()
-    database = health_data.get("database") or {}
-    redis_info = health_data.get("redis") or {}
-    environment = health_data.get("environment") or "unknown"
-    timestamp = health_data.get("timestamp") or ""
-    pool = database.get("pool") or {}
-
-    pool_size = pool.get("size") or 0
-    checked_out = pool.get("checked_out") or 0
-    max_overflow = pool.get("max_overflow") or 0
-    total_capacity = pool_size + max_overflow if pool_size or max_overflow else 0
-    utilization = round((checked_out / total_capacity) * 100, 2) if total_capacity else 0.0
-
-    initial_payload = json.dumps(health_data)
-
-    return f"""<!DOCTYPE html>
+# Static dashboard shell, encoded once. The inline script fills every metric from
+# the embedded JSON payload on load and then polls /health.json, so only the
+# payload changes between requests.
+_HEALTH_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1.0" />
     <title>LeadScore AI • Health Center</title>
     <style>
-        :root {{
+        :root {
             --navy-dark: #050d1f;
             --navy: #0b1f3a;
             --navy-light: #132c54;
@@ -344,86 +411,86 @@ def render_health_dashboard(health_data: dict) -> str:
             --success: #06d6a0;
             --warning: #f6ad55;
             --danger: #f26464;
-        }}
+        }
 
-        * {{
+        * {
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             margin: 0;
             font-family: "Inter", -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
             background: var(--navy-dark);
             color: var(--navy);
-        }}
+        }
 
-        header {{
+        header {
             padding: 36px 6vw 28px;
             background: var(--navy);
             color: var(--white);
             box-shadow: 0 10px 40px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        header h1 {{
+        header h1 {
             margin: 0 0 8px;
             font-size: 34px;
             font-weight: 700;
-        }}
+        }
 
-        header p {{
+        header p {
             margin: 0;
             color: rgba(255, 255, 255, 0.7);
             font-size: 15px;
-        }}
+        }
 
-        main {{
+        main {
             background: var(--background);
             padding: 32px 6vw 48px;
             min-height: calc(100vh - 140px);
-        }}
+        }
 
-        .grid {{
+        .grid {
             display: grid;
             gap: 24px;
-        }}
+        }
 
-        .grid-3 {{
+        .grid-3 {
             grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
-        }}
+        }
 
-        .grid-2 {{
+        .grid-2 {
             grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
-        }}
+        }
 
-        .card {{
+        .card {
             background: var(--white);
             border-radius: 20px;
             padding: 24px;
             box-shadow: 0 16px 40px rgba(11, 31, 58, 0.08);
-        }}
+        }
 
-        .card h2 {{
+        .card h2 {
             margin: 0 0 12px;
             font-size: 15px;
             letter-spacing: 0.12em;
             font-weight: 600;
             color: var(--navy-light);
             text-transform: uppercase;
-        }}
+        }
 
-        .metric {{
+        .metric {
             font-size: 32px;
             font-weight: 700;
             margin-bottom: 6px;
             color: var(--navy);
-        }}
+        }
 
-        .meta {{
+        .meta {
             font-size: 13px;
             color: rgba(11, 31, 58, 0.6);
-        }}
+        }
 
-        .status-chip {{
+        .status-chip {
             display: inline-flex;
             align-items: center;
             padding: 8px 14px;
@@ -431,49 +498,49 @@ def render_health_dashboard(health_data: dict) -> str:
             font-size: 12px;
             font-weight: 600;
             letter-spacing: 0.18em;
-        }}
+        }
 
-        .status-chip.HEALTHY {{
+        .status-chip.HEALTHY {
             background: rgba(6, 214, 160, 0.2);
             color: var(--success);
-        }}
+        }
 
-        .status-chip.DEGRADED {{
+        .status-chip.DEGRADED {
             background: rgba(246, 173, 85, 0.24);
             color: #c05621;
-        }}
+        }
 
-        .status-chip.DISCONNECTED {{
+        .status-chip.DISCONNECTED {
             background: rgba(242, 100, 100, 0.24);
             color: var(--danger);
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             font-size: 14px;
-        }}
+        }
 
-        th {{
+        th {
             text-align: left;
             padding: 6px 0;
             color: rgba(11, 31, 58, 0.6);
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
+        }
 
-        td {{
+        td {
             padding: 6px 0;
             color: rgba(11, 31, 58, 0.82);
-        }}
+        }
 
-        .footer {{
+        .footer {
             margin-top: 32px;
             text-align: center;
             font-size: 13px;
             color: rgba(11, 31, 58, 0.55);
-        }}
+        }
     </style>
 </head>
 <body>
@@ -485,19 +552,19 @@ def render_health_dashboard(health_data: dict) -> str:
         <div class="grid grid-3">
             <div class="card">
                 <h2>System Status</h2>
-                <div id="system-chip" class="status-chip {status}">{status}</div>
-                <div class="meta" id="timestamp-value">Updated {timestamp}</div>
+                <div id="system-chip" class="status-chip UNKNOWN">UNKNOWN</div>
+                <div class="meta" id="timestamp-value">Updated --</div>
             </div>
             <div class="card">
                 <h2>Environment</h2>
-                <div class="metric" id="environment-value">{environment}</div>
+                <div class="metric" id="environment-value">--</div>
                 <div class="meta">Railway environment</div>
             </div>
             <div class="card">
                 <h2>Database Utilization</h2>
-                <div class="metric" id="db-utilization">{utilization}%</div>
+                <div class="metric" id="db-utilization">--%</div>
                 <div class="meta" id="db-connections">
-                    Active connections: {checked_out} / {pool_size}
+                    Active connections: -- / --
                 </div>
             </div>
         </div>
@@ -505,22 +572,22 @@ def render_health_dashboard(health_data: dict) -> str:
         <div class="grid grid-2" style="margin-top: 24px;">
             <div class="card">
                 <h2>Database</h2>
-                <div id="db-chip" class="status-chip {(database.get('status') or 'unknown').upper()}">{(database.get('status') or 'unknown').upper()}</div>
+                <div id="db-chip" class="status-chip UNKNOWN">UNKNOWN</div>
                 <table style="margin-top: 12px;">
-                    <tr><th>Checked In</th><td id="db-checked-in">{pool.get('checked_in', 0)}</td></tr>
-                    <tr><th>Checked Out</th><td id="db-checked-out">{pool.get('checked_out', 0)}</td></tr>
-                    <tr><th>Overflow</th><td id="db-overflow">{pool.get('overflow', 0)}</td></tr>
-                    <tr><th>Error</th><td id="db-error">{database.get('error', '')}</td></tr>
+                    <tr><th>Checked In</th><td id="db-checked-in">--</td></tr>
+                    <tr><th>Checked Out</th><td id="db-checked-out">--</td></tr>
+                    <tr><th>Overflow</th><td id="db-overflow">--</td></tr>
+                    <tr><th>Error</th><td id="db-error"></td></tr>
                 </table>
             </div>
             <div class="card">
                 <h2>Redis Cache</h2>
-                <div id="redis-chip" class="status-chip {(redis_info.get('status') or 'unknown').upper()}">{(redis_info.get('status') or 'unknown').upper()}</div>
+                <div id="redis-chip" class="status-chip UNKNOWN">UNKNOWN</div>
                 <table style="margin-top: 12px;">
-                    <tr><th>Clients</th><td id="redis-clients">{redis_info.get('connected_clients', '--')}</td></tr>
-                    <tr><th>Ops / sec</th><td id="redis-ops">{redis_info.get('ops_per_sec', '--')}</td></tr>
-                    <tr><th>Memory</th><td id="redis-memory">{redis_info.get('memory', '--')}</td></tr>
-                    <tr><th>Error</th><td id="redis-error">{redis_info.get('error', '')}</td></tr>
+                    <tr><th>Clients</th><td id="redis-clients">--</td></tr>
+                    <tr><th>Ops / sec</th><td id="redis-ops">--</td></tr>
+                    <tr><th>Memory</th><td id="redis-memory">--</td></tr>
+                    <tr><th>Error</th><td id="redis-error"></td></tr>
                 </table>
             </div>
         </div>
@@ -528,22 +595,23 @@ def render_health_dashboard(health_data: dict) -> str:
         <div class="footer">Dashboard auto-refreshes every 10 seconds.</div>
     </main>
 
-    <script type="application/json" id="health-data">{initial_payload}</script>
+    <script type="application/json" id="health-data">""".encode()
+_HEALTH_HTML_TAIL = """</script>
     <script>
         const dataElement = document.getElementById("health-data");
 
-        function applyStatusChip(id, status) {{
+        function applyStatusChip(id, status) {
             const el = document.getElementById(id);
             if (!el) return;
             el.textContent = status;
             el.className = "status-chip " + status;
-        }}
+        }
 
-        function updateUI(data) {{
+        function updateUI(data) {
             const status = (data.status || "unknown").toUpperCase();
-            const db = data.database || {{}};
-            const pool = db.pool || {{}};
-            const redis = data.redis || {{}};
+            const db = data.database || {};
+            const pool = db.pool || {};
+            const redis = data.redis || {};
 
             const poolSize = pool.size || 0;
             const checkedOut = pool.checked_out || 0;
@@ -572,214 +640,368 @@ def render_health_dashboard(health_data: dict) -> str:
             document.getElementById("redis-ops").textContent = redis.ops_per_sec ?? "--";
             document.getElementById("redis-memory").textContent = redis.memory ?? "--";
             document.getElementById("redis-error").textContent = redis.error || "";
-        }}
+        }
 
-        async function refresh() {{
-            try {{
-                const response = await fetch("/health.json", {{ cache: "no-store" }});
+        async function refresh() {
+            // Background tabs skip the poll; the next visible tick catches up
+            if (document.hidden) return;
+            try {
+                const response = await fetch("/health.json", { cache: "no-store" });
                 if (!response.ok) return;
                 const data = await response.json();
                 updateUI(data);
-            }} catch (err) {{
+            } catch (err) {
                 console.warn("Health refresh failed", err);
-            }}
-        }}
+            }
+        }
 
         updateUI(JSON.parse(dataElement.textContent));
         setInterval(refresh, 10000);
     </script>
 </body>
-</html>"""
-    
-    return html
+</html>""".encode()
 
 
-@app.get("/test")
-def test_endpoint():
-    """Simple test endpoint to verify routing."""
-    return {"message": "Test endpoint works!", "status": "ok"}
+def health_dashboard_bytes(health_json: bytes) -> bytes:
+    """Return the dashboard page with ``health_json`` embedded as its initial payload."""
+    # Keep "</script>" inside error strings from closing the JSON script element
+    return _HEALTH_HTML_HEAD + health_json.replace(b"</", b"<\\/") + _HEALTH_HTML_TAIL
 
 
-@app.get("/docs-alias")
-def docs_alias():
-    """Alternative endpoint that redirects to docs."""
-    from fastapi.responses import RedirectResponse
-    return RedirectResponse(url="/docs")
+def render_health_dashboard(health_data: dict) -> str:
+    """Render the health dashboard for ``health_data``."""
+    return health_dashboard_bytes(orjson.dumps(health_data)).decode()
+
+
+def openapi_bytes(application: FastAPI) -> bytes:
+    """Encode the OpenAPI schema once and reuse the bytes afterwards.
+
+    ``application.openapi()`` memoizes the schema dict itself, which the
+    built-in ``/openapi.json`` and Swagger UI keep using.
+    """
+    cached = getattr(application.state, "openapi_bytes", None)
+    if cached is None:
+        cached = application.state.openapi_bytes = orjson.dumps(application.openapi())
+    return cached
 
 
 @app.get("/api/openapi.json")
 def openapi_json_alias():
     """Alternative OpenAPI endpoint."""
-    return app.openapi()
-
-
-@app.get("/debug/routes")
-def debug_routes():
-    """Debug endpoint to list all available routes."""
-    routes = []
-    for route in app.routes:
-        if hasattr(route, 'path'):
-            methods = list(route.methods) if hasattr(route, 'methods') and route.methods else []
-            route_info = {
-                "path": route.path,
-                "methods": methods,
-                "name": getattr(route, 'name', 'unknown')
-            }
-            routes.append(route_info)
-    return {
-        "routes": routes,
-        "total": len(routes),
-        "docs_enabled": app.docs_url is not None,
-        "redoc_enabled": app.redoc_url is not None
-    }
-
-
-@app.get("/debug/database-url")
-def debug_database_url():
-    """Debug endpoint to show DATABASE_URL configuration."""
-    from app.database import DATABASE_URL
-    
-    # Check all possible sources
-    env_vars = {
-        "DATABASE_URL": os.getenv("DATABASE_URL"),
-        "POSTGRES_URL": os.getenv("POSTGRES_URL"),
-        "PGDATABASE": os.getenv("PGDATABASE"),
-        "POSTGRES_DATABASE_URL": os.getenv("POSTGRES_DATABASE_URL"),
-    }
-    
-    # Mask sensitive parts
-    def mask_url(url: str) -> str:
-        if not url:
-            return "not set"
-        if "@" in url:
-            parts = url.split("@")
-            if len(parts) == 2:
-                auth = parts[0]
-                host = parts[1]
-                if "://" in auth:
-                    scheme = auth.split("://")[0]
-                    masked = f"{scheme}://***:***@{host}"
-                    return masked
-        return url
-    
-    return {
-        "database_url_being_used": mask_url(DATABASE_URL),
-        "database_url_length": len(DATABASE_URL) if DATABASE_URL else 0,
-        "is_localhost": "localhost:5433" in DATABASE_URL or "127.0.0.1:5433" in DATABASE_URL,
-        "environment_variables": {k: bool(v) for k, v in env_vars.items()},
-        "railway_environment": settings.railway_environment,
-        "environment": settings.environment,
-    }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler."""
-    logger.info(f"Starting {settings.app_name}")
-    logger.info(f"Environment: {settings.railway_environment or settings.environment}")
-    logger.info(f"Debug mode: {settings.environment == 'development'}")
-    logger.info(f"Port: {settings.port}")
-    logger.info(f"API docs available at: {app.docs_url}")
-    logger.info(f"ReDoc available at: {app.redoc_url}")
-    logger.info(f"OpenAPI schema available at: {app.openapi_url}")
-    
-    # Check database connection on startup (non-blocking)
-    from app.database import engine, DATABASE_URL
-    if "localhost:5433" in DATABASE_URL or "127.0.0.1:5433" in DATABASE_URL:
-        if settings.environment == "production" or settings.railway_environment:
-            logger.warning("=" * 80)
-            logger.warning("⚠️  WARNING: DATABASE_URL not configured!")
-            logger.warning("=" * 80)
-            logger.warning("Backend is trying to connect to localhost instead of Railway PostgreSQL.")
-            logger.warning("Backend will start but database operations will fail.")
-            logger.warning("")
-            logger.warning("SOLUTION:")
-            logger.warning("1. Go to Railway Dashboard → PostgreSQL Service")
-            logger.warning("2. Click 'Connect Service' and select your Backend service")
-            logger.warning("3. Railway will automatically set DATABASE_URL")
-            logger.warning("")
-            logger.warning("OR manually set in Backend Service → Variables:")
-            logger.warning("  Name: DATABASE_URL")
-            logger.warning("  Value: [Copy from PostgreSQL Service → Variables → DATABASE_URL]")
-            logger.warning("=" * 80)
-    
+    return Response(content=openapi_bytes(app), media_type="application/json")
+
+
+# Routes are static once configure_routers() has run; built in startup_event
+_ROUTE_TABLE: tuple = ()
+
+
+def build_route_table(application: FastAPI) -> tuple:
+    """Snapshot the registered routes as an immutable table."""
+    table = []
+    for route in application.routes:
+        path = getattr(route, "path", None)
+        if path is None:
+            continue
+        # Sorted once here so the log and /debug/routes output are stable
+        table.append({
+            "path": path,
+            "methods": sorted(route.methods) if getattr(route, "methods", None) else [],
+            "name": getattr(route, "name", "unknown"),
+        })
+    return tuple(table)
+
+
+def routes_blob(application: FastAPI) -> bytes:
+    """Encode the /debug/routes payload once; routes are static after startup."""
+    cached = getattr(application.state, "routes_blob", None)
+    if cached is None:
+        routes = _ROUTE_TABLE or build_route_table(application)
+        cached = application.state.routes_blob = orjson.dumps({
+            "routes": routes,
+            "total": len(routes),
+            "docs_enabled": application.docs_url is not None,
+            "redoc_enabled": application.redoc_url is not None
+        })
+    return cached
+
+
+def configure_debug_routes(application: FastAPI) -> None:
+    """Attach diagnostic endpoints; skipped in production to keep the route table small."""
+
+    # Simple test endpoint to verify routing
+    application.add_route("/test", StaticJSONEndpoint(_TEST_BODY), methods=["GET"], include_in_schema=False)
+
+    @application.get("/docs-alias")
+    def docs_alias():
+        """Alternative endpoint that redirects to docs."""
+        return RedirectResponse(url="/docs")
+
+    @application.get("/debug/routes")
+    def debug_routes():
+        """Debug endpoint to list all available routes."""
+        return Response(content=routes_blob(application), media_type="application/json")
+
+    @application.get("/debug/database-url")
+    def debug_database_url():
+        """Debug endpoint to show DATABASE_URL configuration."""
+        # Env vars don't change mid-run, so the report is encoded on first use
+        cached = getattr(application.state, "dbg_dburl_blob", None)
+        if cached is None:
+            cached = application.state.dbg_dburl_blob = orjson.dumps({
+                "database_url_being_used": MASKED_DATABASE_URL,
+                "database_url_length": len(DATABASE_URL) if DATABASE_URL else 0,
+                "is_localhost": IS_DEFAULT_LOCAL_DATABASE,
+                # Check all possible sources
+                "environment_variables": {key: bool(os.environ.get(key)) for key in DATABASE_URL_ENV_KEYS},
+                "railway_environment": settings.railway_environment,
+                "environment": settings.environment,
+            })
+        return Response(content=cached, media_type="application/json")
+
+
+def _select_one() -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+async def _ping_database() -> None:
+    await run_in_threadpool(_select_one)
+
+
+# Health checks read app.state.db_ok instead of running their own SELECT 1
+DB_PROBE_INTERVAL = 5.0
+# A dead database must not hold up readiness for the full connect timeout
+STARTUP_DB_PING_TIMEOUT = 3.0
+# Re-resolve the pinned database address about once a minute
+DB_HOST_REFRESH_PROBES = 12
+
+
+async def _database_probe_loop(application: FastAPI) -> None:
+    """Round-trip to the database every DB_PROBE_INTERVAL seconds.
+
+    Every DB_HOST_REFRESH_PROBES rounds the pinned database address is re-resolved
+    too, so a moved database host is picked up by new pool connections.
+    """
+    probes = 0
+    while True:
+        probes += 1
+        if probes % DB_HOST_REFRESH_PROBES == 0:
+            try:
+                await resolve_database_host()
+            except OSError as exc:  # pragma: no cover - network dependent
+                logger.warning("Database host lookup failed, unpinning address: %s", exc)
+        try:
+            await _ping_database()
+            application.state.db_ok = True
+            application.state.db_error = None
+        except Exception as exc:  # pragma: no cover - network/resource dependent
+            if application.state.db_ok is not False:
+                logger.warning("Database health probe failed: %s", exc)
+            application.state.db_ok = False
+            application.state.db_error = str(exc)
+        await asyncio.sleep(DB_PROBE_INTERVAL)
+
+
+# Multi-line startup diagnostics, each emitted as a single log record
+_BANNER_RULE = "=" * 80
+_DB_URL_MISSING_BANNER = f"""{_BANNER_RULE}
+⚠️  WARNING: DATABASE_URL not configured!
+{_BANNER_RULE}
+Backend is trying to connect to localhost instead of Railway PostgreSQL.
+Backend will start but database operations will fail.
+
+SOLUTION:
+1. Go to Railway Dashboard → PostgreSQL Service
+2. Click 'Connect Service' and select your Backend service
+3. Railway will automatically set DATABASE_URL
+
+OR manually set in Backend Service → Variables:
+  Name: DATABASE_URL
+  Value: [Copy from PostgreSQL Service → Variables → DATABASE_URL]
+{_BANNER_RULE}"""
+_DB_LOCAL_FAILURE_MESSAGE = (
+    "⚠️  Database connection failed: %s\n"
+    "Backend will continue starting but database features won't work.\n"
+    "Connect PostgreSQL service to Backend service in Railway to fix this."
+)
+_DB_DNS_BANNER = f"""{_BANNER_RULE}
+⚠️  DATABASE DNS RESOLUTION FAILURE
+{_BANNER_RULE}
+Error: %s
+
+CAUSE: DATABASE_URL hostname cannot be resolved
+
+SOLUTION:
+1. Railway Dashboard → PostgreSQL Service → Variables
+2. Copy DATABASE_URL value (full URL, not ${{{{ references}})
+3. Railway Dashboard → Backend Service → Variables
+4. Set DATABASE_URL = [paste the actual URL]
+5. Ensure no ${{{{ Postgres.DATABASE_URL }}}} syntax
+6. Redeploy backend service
+{_BANNER_RULE}"""
+
+
+def _is_dns_failure(exc: BaseException, error_str: str) -> bool:
+    """True if ``exc`` (or the driver error it wraps) is a hostname lookup failure."""
+    seen = exc
+    while seen is not None:
+        if isinstance(seen, socket.gaierror):
+            return True
+        seen = getattr(seen, "orig", None) or seen.__cause__
+    # psycopg re-raises resolver errors as OperationalError with only the message kept
+    return "Name or service not known" in error_str or "[Errno -2]" in error_str
+
+
+async def _deferred_init(application: FastAPI) -> None:
+    """Startup checks that run after the server is already accepting traffic."""
+    try:
+        await _run_startup_checks(application)
+    except Exception:  # pragma: no cover - diagnostics must never kill the app
+        logger.exception("Deferred startup checks failed")
+    finally:
+        application.state.ready = True
+        logger.info("✅ Application ready")
+
+
+async def _check_database() -> None:
+    """Resolve, ping and warm up the database, logging (not raising) any failure."""
     # Test database connection (non-blocking - don't fail startup)
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        # Resolve the host once so the warm-up and later pool connects skip DNS
+        await asyncio.wait_for(resolve_database_host(), timeout=STARTUP_DB_PING_TIMEOUT)
+        await asyncio.wait_for(_ping_database(), timeout=STARTUP_DB_PING_TIMEOUT)
         logger.info("✅ Database connection successful")
+        warmed = await warm_up_pool(engine)
+        logger.info("✅ Database pool warmed up with %d connections", warmed)
     except Exception as e:
-        error_str = str(e)
-        if "localhost:5433" in DATABASE_URL or "127.0.0.1:5433" in DATABASE_URL:
-            logger.warning(f"⚠️  Database connection failed: {error_str}")
-            logger.warning("Backend will continue starting but database features won't work.")
-            logger.warning("Connect PostgreSQL service to Backend service in Railway to fix this.")
-        elif "Name or service not known" in error_str or "[Errno -2]" in error_str:
-            logger.error("=" * 80)
-            logger.error("⚠️  DATABASE DNS RESOLUTION FAILURE")
-            logger.error("=" * 80)
-            logger.error(f"Error: {error_str}")
-            logger.error("")
-            logger.error("CAUSE: DATABASE_URL hostname cannot be resolved")
-            logger.error("")
-            logger.error("SOLUTION:")
-            logger.error("1. Railway Dashboard → PostgreSQL Service → Variables")
-            logger.error("2. Copy DATABASE_URL value (full URL, not ${{ references})")
-            logger.error("3. Railway Dashboard → Backend Service → Variables")
-            logger.error("4. Set DATABASE_URL = [paste the actual URL]")
-            logger.error("5. Ensure no ${{ Postgres.DATABASE_URL }} syntax")
-            logger.error("6. Redeploy backend service")
-            logger.error("=" * 80)
+        error_str = str(e) or type(e).__name__
+        if IS_DEFAULT_LOCAL_DATABASE:
+            logger.warning(_DB_LOCAL_FAILURE_MESSAGE, error_str)
+        elif _is_dns_failure(e, error_str):
+            logger.error(_DB_DNS_BANNER, error_str)
         else:
-            logger.warning(f"⚠️  Database connection failed: {error_str}")
-            logger.warning("Please check your DATABASE_URL configuration.")
+            logger.warning(
+                "⚠️  Database connection failed: %s\nPlease check your DATABASE_URL configuration.", error_str
+            )
         # Don't raise - allow backend to start even without database
+
+
+async def _prebuild_openapi(application: FastAPI) -> None:
+    """Build and encode the OpenAPI schema off the event loop so the first docs hit is fast."""
+    try:
+        await run_in_threadpool(openapi_bytes, application)
+    except Exception:  # pragma: no cover - the schema is rebuilt on first request instead
+        logger.exception("Failed to prebuild the OpenAPI schema")
+
+
+async def _run_startup_checks(application: FastAPI) -> None:
+    """Log configuration, probe the database and snapshot the route table."""
+    logger.info(
+        "Starting %s: env=%s debug=%s port=%s docs=%s redoc=%s openapi=%s",
+        APP_NAME,
+        ENVIRONMENT_NAME,
+        settings.environment == "development",
+        settings.port,
+        application.docs_url,
+        application.redoc_url,
+        application.openapi_url,
+    )
     
-    # Log all registered routes for debugging
-    logger.info("Registered routes:")
-    for route in app.routes:
-        if hasattr(route, 'path'):
-            methods = list(route.methods) if hasattr(route, 'methods') and route.methods else []
-            logger.info(f"  {methods} {route.path}")
+    # Check database connection on startup (non-blocking)
+    if IS_DEFAULT_LOCAL_DATABASE and IS_PRODUCTION:
+        logger.warning(_DB_URL_MISSING_BANNER)
+
+    # The database checks and the OpenAPI build are independent I/O and CPU work;
+    # each task logs its own failure so one cannot cancel the other
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_check_database())
+        tg.create_task(_prebuild_openapi(application))
+
+    if settings.environment == "production":
+        # Production keeps only the critical check; /debug/routes is not registered there
+        if not application.state.routes_by_segment.get("/auth"):
+            logger.error("❌ No auth routes found! This will cause 404 errors on login.")
+        return
+    _log_route_diagnostics(application)
+
+
+def _log_route_diagnostics(application: FastAPI) -> None:
+    """Snapshot the route table for /debug/routes and log the auth/login routes."""
+    global _ROUTE_TABLE
+    _ROUTE_TABLE = build_route_table(application)
+    routes_blob(application)
+    # Only build the full listing when it will actually be emitted (DEBUG is the development level)
+    if logger.isEnabledFor(logging.DEBUG):
+        route_summary = "\n".join(f"  {route['methods']} {route['path']}" for route in _ROUTE_TABLE)
+        logger.debug("Registered routes:\n%s", route_summary)
     
-    # Verify auth routes are registered
-    auth_routes = [r for r in app.routes if hasattr(r, 'path') and '/auth' in r.path]
+    # Verify auth and login routes are registered (indexed in configure_routers)
+    routes_by_segment = application.state.routes_by_segment
+    auth_routes = routes_by_segment.get("/auth", ())
+    login_routes = routes_by_segment.get("/login", ())
+
     if auth_routes:
-        logger.info(f"✅ Auth routes registered: {len(auth_routes)} routes")
-        for route in auth_routes[:5]:  # Show first 5
-            methods = list(route.methods) if hasattr(route, 'methods') and route.methods else []
-            logger.info(f"  Auth route: {methods} {route.path}")
+        logger.info(
+            "✅ Auth routes registered: %d routes\n%s",
+            len(auth_routes),
+            "\n".join(f"  Auth route: {sorted(getattr(route, 'methods', None) or ())} {route.path}" for route in auth_routes[:5]),  # Show first 5
+        )
     else:
         logger.error("❌ No auth routes found! This will cause 404 errors on login.")
     
     # Verify login route specifically
-    login_routes = [r for r in app.routes if hasattr(r, 'path') and '/login' in r.path]
     if login_routes:
-        logger.info(f"✅ Login route found:")
-        for route in login_routes:
-            methods = list(route.methods) if hasattr(route, 'methods') and route.methods else []
-            logger.info(f"  Login: {methods} {route.path}")
+        logger.info(
+            "✅ Login route found:\n%s",
+            "\n".join(f"  Login: {sorted(getattr(route, 'methods', None) or ())} {route.path}" for route in login_routes),
+        )
     else:
         logger.error("❌ Login route not found! Check auth router registration.")
 
 
-# Configure middleware (order matters - add security and monitoring first)
-# IMPORTANT: CORS must be added BEFORE SecurityHeadersMiddleware to avoid conflicts
-configure_cors(app)  # CORS first - before other middleware
-app.add_middleware(CORSFixMiddleware)  # CORS fix - ensures headers are never lost (runs AFTER CORS)
-app.add_middleware(RequestValidationMiddleware)  # Validate requests first
-app.add_middleware(SecurityHeadersMiddleware)  # Security headers
-app.add_middleware(CircuitBreakerMiddleware)  # Protect against cascade failures
-app.add_middleware(ConnectionPoolMonitor)    # Monitor connection pool usage
-app.add_middleware(RequestLimitsMiddleware)  # Request size limits
+def register_handlers(application: FastAPI) -> None:
+    """Attach middleware and exception handlers to the application instance."""
+    # Configure middleware (order matters - add security and monitoring first)
+    # IMPORTANT: CORS must be added BEFORE the combined layer that sets the security headers
+    cors_allow_origins = configure_cors(application)  # CORS first - before other middleware
+    # Request size limits, pool monitoring, circuit breaker, CORS fix and security headers in one layer
+    application.add_middleware(CombinedHotPathMiddleware)
+    # Answer /api preflights before any other layer or the router runs
+    application.add_middleware(
+        CORSPreflightASGI,
+        allowed_origins=cors_allow_origins,
+        regex=_CORS_ORIGIN_RE,
+        max_age=settings.cors_max_age,
+    )
+
+    # Register exception handlers in one batch
+    application.exception_handlers.update({
+        RequestValidationError: validation_exception_handler,
+        StarletteHTTPException: http_exception_handler,
+        SQLAlchemyError: database_exception_handler,
+        Exception: global_exception_handler,
+    })
+
+    # Configure rate limiting (optional - can be disabled in development)
+    try:
+        if settings.environment == "production":
+            # Imported lazily so dev/test runs skip loading slowapi and limits
+            from .middleware.rate_limit import configure_rate_limiting
+
+            configure_rate_limiting(application)
+    except Exception:
+        # Rate limiting is optional, continue if it fails
+        pass
+
 
-# Register exception handlers
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.add_exception_handler(StarletteHTTPException, http_exception_handler)
-app.add_exception_handler(SQLAlchemyError, database_exception_handler)
-app.add_exception_handler(Exception, global_exception_handler)
+# Assemble the app in one pass: middleware and exception handlers first, then every
+# route, so nothing is mutated after the first request builds the middleware stack
+# and the OpenAPI schema (built in the lifespan) sees all routers.
+register_handlers(app)
 
 # Configure routers
 configure_routers(app)
-start_email_sync_scheduler(app)
-start_crm_sync_scheduler(app)
+if settings.environment != "production":
+    configure_debug_routes(app)
+# Every route is registered now; parameter-free paths resolve with one dict lookup
+install_static_route_dispatcher(app.router)
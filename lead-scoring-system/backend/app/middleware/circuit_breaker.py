@@ -1,14 +1,13 @@
-"""Circuit breaker middleware for database operations to prevent cascade failures."""
+"""Circuit breaker for database operations to prevent cascade failures."""
 
 import logging
 import time
 from enum import Enum
 from typing import Optional
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import JSONResponse
 from fastapi import status
-from sqlalchemy.exc import SQLAlchemyError, OperationalError
+
+from .cors_fix import add_cors_headers
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +64,15 @@ class DatabaseCircuitBreaker:
                 logger.error(f"❌ Circuit breaker: Opening circuit after {self.failure_count} failures")
                 self.state = CircuitState.OPEN
     
+    def record_response(self, status_code: Optional[int], database_error: bool) -> None:
+        """Record the outcome of a response observed by the middleware."""
+        # Record success for successful responses
+        if status_code is not None and status_code < 500:
+            self.record_success()
+        elif database_error:
+            # Only count database-related 500s as failures
+            self.record_failure()
+
     def should_allow(self) -> bool:
         """Check if operation should be allowed."""
         if self.state == CircuitState.OPEN:
@@ -85,52 +93,23 @@ class DatabaseCircuitBreaker:
 circuit_breaker = DatabaseCircuitBreaker()
 
 
-class CircuitBreakerMiddleware(BaseHTTPMiddleware):
-    """Middleware to implement circuit breaker for database operations."""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Only apply to routes that use database
-        if not any(path in request.url.path for path in ["/api/", "/auth/", "/health"]):
-            return await call_next(request)
-        
-        # Check circuit breaker before processing
-        if not circuit_breaker.should_allow():
-            logger.warning(f"Circuit breaker OPEN: Rejecting request to {request.url.path}")
-            origin = request.headers.get("origin")
-            response = JSONResponse(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                content={
-                    "detail": "Database service temporarily unavailable. Please try again in a moment.",
-                    "type": "circuit_breaker_open",
-                },
-            )
-            # Add CORS headers to circuit breaker response
-            if origin:
-                response.headers["Access-Control-Allow-Origin"] = origin
-                response.headers["Access-Control-Allow-Credentials"] = "true"
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD"
-            response.headers["Access-Control-Allow-Headers"] = "*"
-            return response
-        
-        try:
-            response = await call_next(request)
-            
-            # Record success for successful responses
-            if response.status_code < 500:
-                circuit_breaker.record_success()
-            else:
-                # Only count database-related 500s as failures
-                if "database" in response.body.decode(errors="ignore").lower() if hasattr(response, 'body') else False:
-                    circuit_breaker.record_failure()
-            
-            return response
-            
-        except (SQLAlchemyError, OperationalError) as e:
-            # Database errors trigger circuit breaker
-            circuit_breaker.record_failure()
-            logger.error(f"Database error triggering circuit breaker: {e}")
-            raise  # Let error handler deal with it
-        except Exception:
-            # Re-raise to let error handlers deal with it
-            raise
+def uses_database(path: str) -> bool:
+    """Whether the circuit breaker applies to this path."""
+    # Liveness must answer even when the DB is down
+    if path == "/health/live":
+        return False
+    return any(prefix in path for prefix in ("/api/", "/auth/", "/health"))
+
 
+def circuit_open_response(origin: Optional[str]) -> JSONResponse:
+    """503 returned while the circuit is open."""
+    response = JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": "Database service temporarily unavailable. Please try again in a moment.",
+            "type": "circuit_breaker_open",
+        },
+    )
+    # Add CORS headers to circuit breaker response
+    add_cors_headers(response.headers, origin)
+    return response
@@ -6,8 +6,12 @@ from starlette.responses import Response
 from typing import List
 import logging
 
+from app.config import get_settings
+
 logger = logging.getLogger(__name__)
 
+CORS_MAX_AGE = str(get_settings().cors_max_age)
+
 class DynamicCORSMiddleware(BaseHTTPMiddleware):
     """
     Enhanced CORS middleware that allows Railway frontend domains dynamically.
@@ -71,7 +75,7 @@ class DynamicCORSMiddleware(BaseHTTPMiddleware):
                         "Access-Control-Allow-Credentials": "true",
                         "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
                         "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With",
-                        "Access-Control-Max-Age": "3600",
+                        "Access-Control-Max-Age": CORS_MAX_AGE,
                     },
                 )
         
@@ -1,17 +1,20 @@
-"""Comprehensive CORS middleware to ensure all responses include CORS headers.
+"""CORS header helpers that ensure all responses include CORS headers.
 
-This middleware runs AFTER CORS middleware to ensure CORS headers are never lost,
-even if other middleware or error handlers modify responses.
+Applied by the combined middleware after CORSMiddleware, so CORS headers are
+never lost even if other layers or error handlers modify responses.
 """
 
 import re
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Preflights are answered here, so this is the Max-Age browsers actually see
+CORS_MAX_AGE = str(get_settings().cors_max_age)
+
 # Allowed origins patterns
 RAILWAY_PATTERN = re.compile(r"https://.*\.up\.railway\.app|https://.*\.railway\.app")
 VENTRIX_PATTERN = re.compile(r"https?://(?:[\w-]+\.)?ventrix\.tech")
@@ -40,75 +43,63 @@ def is_origin_allowed(origin: str) -> bool:
     if origin in EXPLICIT_ORIGINS:
         return True
     
-    # Check Railway pattern
-    if RAILWAY_PATTERN.match(origin):
+    # Check Railway pattern (fullmatch: "https://x.railway.app.evil.com" is not allowed)
+    if RAILWAY_PATTERN.fullmatch(origin):
         return True
     
     # Check ventrix.tech pattern
-    if VENTRIX_PATTERN.match(origin):
+    if VENTRIX_PATTERN.fullmatch(origin):
         return True
     
     # Check localhost (development)
-    if LOCALHOST_PATTERN.match(origin):
+    if LOCALHOST_PATTERN.fullmatch(origin):
         return True
     
     return False
 
 
-def add_cors_headers(response: Response, origin: str | None) -> None:
-    """Add CORS headers to response."""
+CORS_ALLOW_METHODS = "GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD"
+
+
+def add_cors_headers(headers: MutableHeaders, origin: str | None) -> None:
+    """Add CORS headers to a response's headers.
+
+    Only an allowed origin is echoed back, with credentials. Any other origin
+    gets no ``Access-Control-Allow-Origin`` at all, so the browser blocks the
+    read; a ``*`` is never sent because the frontend uses credentials.
+    """
     if origin and is_origin_allowed(origin):
-        response.headers["Access-Control-Allow-Origin"] = origin
-        response.headers["Access-Control-Allow-Credentials"] = "true"
-    else:
-        # Fallback: allow all origins if no origin specified (less secure but ensures CORS works)
-        response.headers["Access-Control-Allow-Origin"] = "*"
-    
+        headers["Access-Control-Allow-Origin"] = origin
+        headers["Access-Control-Allow-Credentials"] = "true"
+
     # Always add these headers
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    response.headers["Access-Control-Expose-Headers"] = "*"
-    response.headers["Access-Control-Max-Age"] = "3600"
+    headers["Access-Control-Allow-Methods"] = CORS_ALLOW_METHODS
+    headers["Access-Control-Allow-Headers"] = "*"
+    headers["Access-Control-Expose-Headers"] = "*"
+    headers["Access-Control-Max-Age"] = CORS_MAX_AGE
 
 
-class CORSFixMiddleware(BaseHTTPMiddleware):
-    """Middleware to ensure CORS headers are always present on all responses."""
-    
-    async def dispatch(self, request: Request, call_next):
-        origin = request.headers.get("origin")
-        
-        # Handle OPTIONS preflight requests
-        if request.method == "OPTIONS":
-            response = Response()
-            add_cors_headers(response, origin)
-            logger.info(f"✅ OPTIONS preflight handled for {request.url.path} from {origin}")
-            return response
-        
-        # Process the request
-        response = await call_next(request)
-        
-        # CRITICAL: Ensure CORS headers are present on ALL responses
-        # Check if CORS headers already exist - if not, add them
-        # If they exist but don't match the origin, update them
-        if "Access-Control-Allow-Origin" not in response.headers:
-            # No CORS headers - add them
-            add_cors_headers(response, origin)
-            if origin:
-                logger.debug(f"✅ CORS headers added for {request.url.path} from {origin}")
-        else:
-            # Headers exist - verify they're correct for this origin
-            existing_origin = response.headers.get("Access-Control-Allow-Origin")
-            if origin and is_origin_allowed(origin):
-                if existing_origin != origin and existing_origin != "*":
-                    # Update to match the request origin
-                    response.headers["Access-Control-Allow-Origin"] = origin
-                    response.headers["Access-Control-Allow-Credentials"] = "true"
-                    logger.debug(f"✅ CORS origin updated for {request.url.path}: {existing_origin} -> {origin}")
-            # Ensure other CORS headers are present
-            if "Access-Control-Allow-Methods" not in response.headers:
-                response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD"
-            if "Access-Control-Allow-Headers" not in response.headers:
-                response.headers["Access-Control-Allow-Headers"] = "*"
-        
-        return response
+def ensure_cors_headers(headers: MutableHeaders, origin: str | None, path: str) -> None:
+    """Add missing CORS headers, or correct the origin of existing ones."""
+    # Check if CORS headers already exist - if not, add them
+    # If they exist but don't match the origin, update them
+    existing_origin = headers.get("Access-Control-Allow-Origin")
+    if existing_origin is None:
+        # No CORS headers - add them
+        add_cors_headers(headers, origin)
+        if origin:
+            logger.debug(f"✅ CORS headers added for {path} from {origin}")
+        return
 
+    # Headers exist - verify they're correct for this origin
+    if origin and is_origin_allowed(origin):
+        if existing_origin != origin and existing_origin != "*":
+            # Update to match the request origin
+            headers["Access-Control-Allow-Origin"] = origin
+            headers["Access-Control-Allow-Credentials"] = "true"
+            logger.debug(f"✅ CORS origin updated for {path}: {existing_origin} -> {origin}")
+    # Ensure other CORS headers are present
+    if "Access-Control-Allow-Methods" not in headers:
+        headers["Access-Control-Allow-Methods"] = CORS_ALLOW_METHODS
+    if "Access-Control-Allow-Headers" not in headers:
+        headers["Access-Control-Allow-Headers"] = "*"
@@ -0,0 +1,66 @@
+"""Pure ASGI short-circuit for CORS preflight requests under /api."""
+
+import re
+from typing import Iterable, Optional, Pattern, Union
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_METHODS = b"GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD"
+
+
+class CORSPreflightASGI:
+    """Answer ``OPTIONS /api/...`` preflights directly from the ASGI scope.
+
+    Registered outermost so preflights never reach the routing layer or the
+    other middlewares. The static part of the response headers is built once
+    in ``__init__``; per request only the origin (and any requested headers)
+    are read from ``scope["headers"]`` in a single pass.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allowed_origins: Iterable[str] = (),
+        regex: Optional[Union[str, Pattern[str]]] = None,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allowed_origins = frozenset(allowed_origins)
+        self.allow_all_origins = "*" in self.allowed_origins
+        self.origin_re = re.compile(regex) if isinstance(regex, str) else regex
+        self.static_headers = [
+            (b"access-control-allow-methods", _METHODS),
+            (b"access-control-expose-headers", b"*"),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+
+    def is_allowed(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.allowed_origins:
+            return True
+        return bool(self.origin_re and self.origin_re.fullmatch(origin))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "OPTIONS" or not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        headers = list(self.static_headers)
+        # A disallowed origin gets no Allow-Origin, so the browser rejects the preflight
+        if origin is not None and self.is_allowed(origin.decode("latin-1")):
+            headers.append((b"access-control-allow-origin", origin))
+            headers.append((b"access-control-allow-credentials", b"true"))
+        # Echo the requested headers; a literal "*" is not honoured for credentialed requests
+        headers.append((b"access-control-allow-headers", requested_headers or b"*"))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
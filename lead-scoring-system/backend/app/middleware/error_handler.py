@@ -5,25 +5,26 @@ from typing import Any
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.config import get_settings
 
+from .cors_fix import VENTRIX_PATTERN
+
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
-def _add_cors_headers(response: JSONResponse, request: Request) -> JSONResponse:
+def _add_cors_headers(response: ORJSONResponse, request: Request) -> ORJSONResponse:
     """Add CORS headers to response to ensure frontend can read error messages."""
-    import re
     origin = request.headers.get("origin")
     if origin:
         # Check if origin is allowed (Railway domains, ventrix.tech, or localhost)
         if (origin.endswith(".up.railway.app") or 
             origin.endswith(".railway.app") or
-            re.match(r"https?://(?:[\w-]+\.)?ventrix\.tech", origin) or
+            VENTRIX_PATTERN.fullmatch(origin) or
             origin == "http://localhost:5173"):
             response.headers["Access-Control-Allow-Origin"] = origin
             response.headers["Access-Control-Allow-Credentials"] = "true"
@@ -36,7 +37,7 @@ def _add_cors_headers(response: JSONResponse, request: Request) -> JSONResponse:
     return response
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
     errors = []
     for error in exc.errors():
@@ -51,7 +52,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
     logger.warning(f"Validation error on {request.url.path}: {errors}")
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
@@ -62,11 +63,11 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     return _add_cors_headers(response, request)
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
     logger.info(f"HTTP {exc.status_code} on {request.url.path}: {exc.detail}")
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
@@ -76,7 +77,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     return _add_cors_headers(response, request)
 
 
-async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> ORJSONResponse:
     """Handle database errors."""
     logger.error(f"Database error on {request.url.path}: {exc}", exc_info=True)
 
@@ -107,7 +108,7 @@ async def database_exception_handler(request: Request, exc: SQLAlchemyError) ->
     else:
         detail = f"Database error: {error_str}"
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": detail,
@@ -117,7 +118,7 @@ async def database_exception_handler(request: Request, exc: SQLAlchemyError) ->
     return _add_cors_headers(response, request)
 
 
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle all unhandled exceptions."""
     logger.error(f"Unhandled exception on {request.url.path}: {exc}", exc_info=True)
 
@@ -135,7 +136,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     else:
         detail = f"Internal error: {str(exc)}"
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": detail,
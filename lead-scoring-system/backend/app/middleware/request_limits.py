@@ -1,10 +1,13 @@
-"""Request size and timeout limits middleware."""
+"""Request size limits."""
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
+from starlette.types import Scope
 from fastapi import status
 import logging
+from typing import Optional
+
+from .cors_fix import add_cors_headers
 
 logger = logging.getLogger(__name__)
 
@@ -12,39 +15,31 @@ logger = logging.getLogger(__name__)
 MAX_REQUEST_SIZE = 1024 * 1024
 
 
-class RequestLimitsMiddleware(BaseHTTPMiddleware):
-    """Enforce request size limits and handle oversized requests."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Check Content-Length header if present
-        content_length = request.headers.get("content-length")
-        if content_length:
-            try:
-                size = int(content_length)
-                if size > MAX_REQUEST_SIZE:
-                    logger.warning(
-                        f"Request too large: {size} bytes from {request.client.host if request.client else 'unknown'}"
-                    )
-                    origin = request.headers.get("origin")
-                    response = JSONResponse(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        content={
-                            "detail": f"Request body too large. Maximum size: {MAX_REQUEST_SIZE // 1024}KB",
-                            "type": "request_too_large",
-                            "max_size_kb": MAX_REQUEST_SIZE // 1024,
-                        },
-                    )
-                    # Add CORS headers to error response
-                    if origin:
-                        response.headers["Access-Control-Allow-Origin"] = origin
-                        response.headers["Access-Control-Allow-Credentials"] = "true"
-                    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH, HEAD"
-                    response.headers["Access-Control-Allow-Headers"] = "*"
-                    return response
-            except ValueError:
-                # Invalid content-length header, let it through
-                pass
-
-        response = await call_next(request)
-        return response
-
+def oversized_request_response(scope: Scope, headers: Headers) -> Optional[JSONResponse]:
+    """Return a 413 response if Content-Length exceeds MAX_REQUEST_SIZE, else None."""
+    # Check Content-Length header if present
+    content_length = headers.get("content-length")
+    if not content_length:
+        return None
+    try:
+        size = int(content_length)
+    except ValueError:
+        # Invalid content-length header, let it through
+        return None
+    if size <= MAX_REQUEST_SIZE:
+        return None
+
+    client = scope.get("client")
+    logger.warning(f"Request too large: {size} bytes from {client[0] if client else 'unknown'}")
+    origin = headers.get("origin")
+    response = JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={
+            "detail": f"Request body too large. Maximum size: {MAX_REQUEST_SIZE // 1024}KB",
+            "type": "request_too_large",
+            "max_size_kb": MAX_REQUEST_SIZE // 1024,
+        },
+    )
+    # Add CORS headers to error response
+    add_cors_headers(response.headers, origin)
+    return response
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, Optional
-
-from fastapi import FastAPI
+from typing import AsyncIterator, Dict
 
 from app.config import get_settings
 from app.database import SessionLocal
@@ -36,7 +35,10 @@ async def _crm_sync_loop(stop_event: asyncio.Event) -> None:
             await _sync_due_integrations()
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.exception("CRM scheduled sync failed: %s", exc)
-        await asyncio.wait([stop_event.wait()], timeout=interval)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
 
 
 async def _sync_due_integrations() -> None:
@@ -79,26 +81,22 @@ async def _run_integration_sync(integration_id: int, provider: str, direction: s
             logger.warning("Unknown CRM provider %s for integration %s", provider, integration_id)
 
 
-def start_crm_sync_scheduler(app: FastAPI) -> None:
-    """Attach scheduler startup/shutdown hooks to the FastAPI app."""
+@asynccontextmanager
+async def crm_sync_scheduler() -> AsyncIterator[None]:
+    """Run the CRM sync loop for the lifetime of the ``async with`` block."""
     stop_event = asyncio.Event()
-    task: Optional[asyncio.Task] = None
-
-    @app.on_event("startup")
-    async def _startup() -> None:  # pragma: no cover
-        nonlocal task
-        if task is None:
-            task = asyncio.create_task(_crm_sync_loop(stop_event))
-
-    @app.on_event("shutdown")
-    async def _shutdown() -> None:  # pragma: no cover
-        if task is not None:
-            stop_event.set()
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+    task = asyncio.create_task(_crm_sync_loop(stop_event))
+    try:
+        yield
+    finally:
+        stop_event.set()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:  # A crashed loop must not break shutdown
+            logger.exception("CRM sync scheduler exited with an error")
 
 
 class _session_scope:
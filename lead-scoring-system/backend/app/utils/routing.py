@@ -0,0 +1,97 @@
+"""Constant-time dispatch for routes whose path has no parameters."""
+
+from __future__ import annotations
+
+import sys
+from typing import Dict, List
+
+from starlette.routing import BaseRoute, Match, Router
+from starlette.types import Receive, Scope, Send
+
+
+def intern_route_strings(routes: List[BaseRoute]) -> None:
+    """Intern each route's path and method names in place.
+
+    Paths built from router prefixes are fresh strings; interning them lets
+    equal paths and methods share one object, so comparisons against the
+    route table and the static index hit the identity fast path.
+    """
+    for route in routes:
+        path = getattr(route, "path", None)
+        if isinstance(path, str):
+            route.path = sys.intern(path)
+        methods = getattr(route, "methods", None)
+        if methods:
+            route.methods = {sys.intern(method) for method in methods}
+
+
+def build_static_route_index(routes: List[BaseRoute]) -> Dict[str, tuple]:
+    """Map each parameter-free path to the routes registered for it, in order.
+
+    A path is left out if an earlier route with a pattern (``/leads/{id}``, a
+    mount, ...) also matches it, because Starlette would pick that route first.
+    """
+    index: Dict[str, list] = {}
+    earlier: list = []
+    for route in routes:
+        path = getattr(route, "path", None)
+        regex = getattr(route, "path_regex", None)
+        if path is None or regex is None:
+            earlier.append(None)  # Unknown route type: nothing after it is safe to index
+            continue
+        if "{" not in path and path not in index:
+            shadowed = any(
+                prior is None or (prior.path != path and prior.path_regex.match(path))
+                for prior in earlier
+            )
+            if not shadowed:
+                index[path] = []
+        if path in index:
+            index[path].append(route)
+        earlier.append(route)
+    return {path: tuple(matches) for path, matches in index.items()}
+
+
+class StaticRouteDispatcher:
+    """Router entry point that resolves parameter-free paths with one dict lookup.
+
+    Installed as ``router.middleware_stack``; any request the index cannot
+    fully match (dynamic paths, wrong method, lifespan) falls through to the
+    router's normal sequential scan, so routing results are unchanged. Under a
+    ``root_path`` the lookup uses the raw ``scope["path"]``; ``route.matches``
+    still decides on the root-relative path, so a prefixed request simply
+    misses the index and is routed by the fallback.
+    """
+
+    def __init__(self, router: Router) -> None:
+        self.router = router
+        self.fallback = router.middleware_stack
+        self.index = build_static_route_index(router.routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        routes = self.index.get(scope.get("path"))
+        if routes and scope["type"] in ("http", "websocket"):
+            for route in routes:
+                match, child_scope = route.matches(scope)
+                if match is Match.FULL:
+                    scope.setdefault("router", self.router)
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+        await self.fallback(scope, receive, send)
+
+
+def install_static_route_dispatcher(router: Router) -> StaticRouteDispatcher:
+    """Intern and index ``router``'s current routes; call once every route is registered."""
+    intern_route_strings(router.routes)
+    dispatcher = StaticRouteDispatcher(router)
+    router.middleware_stack = dispatcher
+    return dispatcher
+
+
+__all__ = [
+    "StaticRouteDispatcher",
+    "build_static_route_index",
+    "install_static_route_dispatcher",
+    "intern_route_strings",
+]
@@ -144,17 +144,19 @@ PORT=${PORT:-8000}
 
 # Calculate optimal workers based on Railway's resources
 # Railway typically provides 1-2 CPU cores, so use appropriate worker count
-WORKERS=${UVICORN_WORKERS:-2}
+WORKERS=${WEB_CONCURRENCY:-${UVICORN_WORKERS:-2}}
 TIMEOUT=${UVICORN_TIMEOUT:-120}
 
 echo "🚀 Starting application on port $PORT with $WORKERS workers..."
-echo "⚙️  Configuration: workers=$WORKERS, timeout=${TIMEOUT}s, backlog=2048"
+echo "⚙️  Configuration: workers=$WORKERS, timeout=${TIMEOUT}s, backlog=2048, loop=uvloop, http=httptools"
 
 # Start uvicorn with optimized settings for high capacity
 exec uvicorn app.main:app \
     --host 0.0.0.0 \
     --port "$PORT" \
     --workers "$WORKERS" \
+    --loop uvloop \
+    --http httptools \
     --timeout-keep-alive "$TIMEOUT" \
     --backlog 2048 \
     --limit-concurrency 1000 \
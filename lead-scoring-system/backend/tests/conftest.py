@@ -5,6 +5,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
+from app.config import get_settings
 from app.database import Base, get_db
 from app.main import app
 from app.models.user import User, UserRole
@@ -18,6 +19,14 @@ engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": Fal
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Give each test a fresh ``get_settings()`` so env changes don't leak between tests."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.fixture(scope="function")
 def db():
     """Create a test database session."""
@@ -0,0 +1,29 @@
+"""Tests for settings parsing."""
+
+import pytest
+
+from app.config import Settings, get_settings
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('["https://a.example", "https://b.example"]', ("https://a.example", "https://b.example")),
+        ('[ "https://a.example" ,\n "https://b\\u002eexample" ]', ("https://a.example", "https://b.example")),
+        ("[]", ()),
+        ("https://a.example, https://b.example,", ("https://a.example", "https://b.example")),
+        ("[https://a.example", ("[https://a.example",)),
+        ('["https://a.example", 1]', ('["https://a.example"', "1]")),
+    ],
+)
+def test_cors_origins_parsing(monkeypatch, raw, expected):
+    """ALLOWED_ORIGINS accepts a JSON array of strings or a comma-separated list."""
+    monkeypatch.setenv("ALLOWED_ORIGINS", raw)
+    assert Settings().cors_origins == expected
+
+
+def test_get_settings_reads_environment_per_test(monkeypatch):
+    """get_settings() is cached, but the conftest fixture resets it between tests."""
+    monkeypatch.setenv("ENVIRONMENT", "staging")
+    assert get_settings().environment == "staging"
+    assert get_settings() is get_settings()
@@ -0,0 +1,66 @@
+"""Tests for CORS handling on preflight and simple requests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+EXPLICIT_ORIGIN = "http://localhost:5173"
+REGEX_ORIGIN = "https://preview-123.up.railway.app"
+DISALLOWED_ORIGINS = ["https://evil.example", "https://ventrix.tech.evil.example"]
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _preflight(client, origin):
+    return client.options(
+        "/api/leads",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "authorization,content-type",
+        },
+    )
+
+
+@pytest.mark.parametrize("origin", [EXPLICIT_ORIGIN, REGEX_ORIGIN])
+def test_preflight_allowed_origin_is_echoed(client, origin):
+    """Allowed origins, explicit or regex-matched, are echoed with credentials."""
+    response = _preflight(client, origin)
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == origin
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-headers"] == "authorization,content-type"
+
+
+@pytest.mark.parametrize("origin", DISALLOWED_ORIGINS)
+def test_preflight_disallowed_origin_gets_no_allow_origin(client, origin):
+    """A disallowed origin gets neither its own origin nor a wildcard back."""
+    response = _preflight(client, origin)
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+
+
+@pytest.mark.parametrize("origin", [EXPLICIT_ORIGIN, REGEX_ORIGIN])
+def test_simple_request_allowed_origin(client, origin):
+    response = client.get("/api/config", headers={"Origin": origin})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == origin
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+@pytest.mark.parametrize("origin", DISALLOWED_ORIGINS)
+def test_simple_request_disallowed_origin_never_gets_wildcard(client, origin):
+    """No '*' is added next to CORSMiddleware's Allow-Credentials for foreign origins."""
+    response = client.get("/api/config", headers={"Origin": origin})
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_non_api_preflight_disallowed_origin(client):
+    """The fallback OPTIONS answer outside /api follows the same rule."""
+    response = client.options("/health", headers={"Origin": DISALLOWED_ORIGINS[0]})
+    assert "access-control-allow-origin" not in response.headers
@@ -0,0 +1,75 @@
+"""Tests for database host pinning."""
+
+import asyncio
+import socket
+
+import pytest
+
+from app import database
+
+
+def _info(family, address):
+    return (family, socket.SOCK_STREAM, 6, "", (address, 5432))
+
+
+@pytest.fixture(autouse=True)
+def unpinned(monkeypatch):
+    monkeypatch.setattr(database, "_pinned_hostaddrs", ())
+
+
+@pytest.mark.asyncio
+async def test_resolve_pins_every_address_in_order(monkeypatch):
+    """All A/AAAA records are kept, deduplicated, so libpq can fail over between them."""
+    async def getaddrinfo(host, port, **kwargs):
+        assert (host, port) == ("db.railway.internal", 5432)
+        return [
+            _info(socket.AF_INET6, "fd12::1"),
+            _info(socket.AF_INET, "10.0.0.7"),
+            _info(socket.AF_INET6, "fd12::1"),
+        ]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    pinned = await database.resolve_database_host("postgresql+psycopg://u:p@db.railway.internal/app")
+    assert pinned == ("fd12::1", "10.0.0.7")
+    assert database._pinned_hostaddrs == pinned
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url",
+    [
+        "postgresql+psycopg://u:p@10.0.0.7:5432/app",
+        "postgresql+psycopg://u:p@[fd12::1]:5432/app",
+        "postgresql+psycopg://u:p@/app?host=/var/run/postgresql",
+    ],
+)
+async def test_resolve_skips_literals_and_sockets(monkeypatch, url):
+    monkeypatch.setattr(database, "_pinned_hostaddrs", ("10.9.9.9",))
+    assert await database.resolve_database_host(url) == ()
+    assert database._pinned_hostaddrs == ()
+
+
+@pytest.mark.asyncio
+async def test_resolve_failure_clears_pin(monkeypatch):
+    async def getaddrinfo(host, port, **kwargs):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    monkeypatch.setattr(database, "_pinned_hostaddrs", ("10.9.9.9",))
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    with pytest.raises(OSError):
+        await database.resolve_database_host("postgresql+psycopg://u:p@db.railway.internal/app")
+    assert database._pinned_hostaddrs == ()
+
+
+def test_connect_hook_passes_matching_host_and_hostaddr_lists(monkeypatch):
+    monkeypatch.setattr(database, "_pinned_hostaddrs", ("fd12::1", "10.0.0.7"))
+    cparams = {"host": "db.railway.internal", "port": 5432}
+    database._use_pinned_hostaddr(None, None, [], cparams)
+    assert cparams["host"] == "db.railway.internal,db.railway.internal"
+    assert cparams["hostaddr"] == "fd12::1,10.0.0.7"
+
+
+def test_connect_hook_leaves_params_alone_when_unpinned():
+    cparams = {"host": "db.railway.internal", "port": 5432}
+    database._use_pinned_hostaddr(None, None, [], cparams)
+    assert cparams == {"host": "db.railway.internal", "port": 5432}
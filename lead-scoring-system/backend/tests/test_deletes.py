@@ -0,0 +1,38 @@
+"""Tests for 204 DELETE routes."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.main import app
+from app.models.user import UserRole
+from app.utils.auth import get_current_user
+
+
+@pytest.fixture
+def admin_client():
+    """Client authenticated as an admin, with a mocked session that finds every row."""
+    admin = SimpleNamespace(id=7, get_role_enum=lambda: UserRole.ADMIN)
+    row = SimpleNamespace(id=1, user_id=admin.id)
+    db = MagicMock()
+    db.query.return_value.filter.return_value.one_or_none.return_value = row
+    db.query.return_value.filter.return_value.first.return_value = row
+
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: admin
+    yield TestClient(app), db, row
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", ["/api/assignment-rules/1", "/api/reports/1"])
+def test_delete_returns_empty_204(admin_client, path):
+    """DELETE answers an empty 204 after deleting and committing the row."""
+    client, db, row = admin_client
+    response = client.delete(path)
+    assert response.status_code == 204
+    assert response.content == b""
+    db.delete.assert_called_once_with(row)
+    db.commit.assert_called_once()
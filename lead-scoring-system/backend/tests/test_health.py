@@ -0,0 +1,88 @@
+"""Tests for the cached health snapshot."""
+
+import asyncio
+from datetime import datetime
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+@pytest.fixture
+def fresh_snapshot(monkeypatch):
+    """Start from an empty snapshot and count calls to collect_health_data."""
+    calls = []
+
+    def collect():
+        calls.append(1)
+        return {"status": "healthy", "calls": len(calls)}
+
+    monkeypatch.setattr(main, "_health_snapshot", (0.0, None, b""))
+    monkeypatch.setattr(main, "_health_refresh", None)
+    monkeypatch.setattr(main, "collect_health_data", collect)
+    return calls
+
+
+def test_health_timestamp_is_formatted_per_call(monkeypatch):
+    """collect_health_data stamps each payload with the current UTC time."""
+    monkeypatch.setattr(main.redis_client, "info", lambda: {})
+    data = main.collect_health_data()
+    assert datetime.fromisoformat(data["timestamp"]).utcoffset().total_seconds() == 0
+
+
+@pytest.mark.asyncio
+async def test_health_snapshot_cached_within_ttl(fresh_snapshot):
+    """Callers inside the TTL reuse the same snapshot bytes."""
+    data, body = await main.get_health_snapshot()
+    again, again_body = await main.get_health_snapshot()
+    assert again_body is body
+    assert orjson.loads(body) == data == {"status": "healthy", "calls": 1}
+    assert len(fresh_snapshot) == 1
+
+
+@pytest.mark.asyncio
+async def test_health_snapshot_single_flight(fresh_snapshot):
+    """Concurrent cold callers share one refresh."""
+    results = await asyncio.gather(*(main.get_health_snapshot() for _ in range(5)))
+    assert len(fresh_snapshot) == 1
+    assert {body for _, body in results} == {results[0][1]}
+
+
+@pytest.mark.asyncio
+async def test_health_snapshot_serves_stale_while_refreshing(fresh_snapshot, monkeypatch):
+    """Once expired, the stale snapshot is returned while a refresh runs."""
+    _, first = await main.get_health_snapshot()
+    monkeypatch.setattr(main, "HEALTH_CACHE_TTL", 0)
+
+    _, stale = await main.get_health_snapshot()
+    assert stale is first
+    await main._health_refresh
+    monkeypatch.setattr(main, "HEALTH_CACHE_TTL", 60)
+
+    _, refreshed = await main.get_health_snapshot()
+    assert orjson.loads(refreshed)["calls"] == 2
+
+
+@pytest.mark.parametrize("path", ["/health/live", "/health.json"])
+def test_health_head_goes_through_exception_handlers(path):
+    """HEAD on a GET-only health route is a handled 405, with the security headers."""
+    response = TestClient(main.app).head(path)
+    assert response.status_code == 405
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+
+def test_health_errors_use_the_global_handler(monkeypatch):
+    """An exception raised in a health handler becomes the app's JSON 500."""
+    async def broken():
+        raise RuntimeError("snapshot failed")
+
+    monkeypatch.setattr(main, "get_health_snapshot", broken)
+    # Debug mode renders a traceback page instead; rebuild the stack without it
+    monkeypatch.setattr(main.app, "debug", False)
+    monkeypatch.setattr(main.app, "middleware_stack", None)
+    response = TestClient(main.app, raise_server_exceptions=False).get("/health.json")
+    assert response.status_code == 500
+    assert response.json()["type"] == "internal_error"
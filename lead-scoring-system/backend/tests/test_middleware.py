@@ -0,0 +1,52 @@
+"""Tests for the combined hot-path middleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware import combined
+from app.middleware.request_limits import MAX_REQUEST_SIZE
+
+
+def _client():
+    application = FastAPI()
+
+    @application.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    @application.post("/ping")
+    def ping_post():
+        return {"ok": True}
+
+    application.add_middleware(combined.CombinedHotPathMiddleware)
+    return TestClient(application)
+
+
+def test_security_headers_added():
+    """Every response carries the security headers."""
+    response = _client().get("/ping")
+    assert response.status_code == 200
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert "content-security-policy" in response.headers
+
+
+def test_oversized_request_rejected():
+    """A Content-Length above the limit is answered with 413 before the app runs."""
+    response = _client().post(
+        "/ping",
+        content=b"x" * (MAX_REQUEST_SIZE + 1),
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 413
+    assert response.json()["type"] == "request_too_large"
+
+
+def test_pool_usage_sampled_by_counter(monkeypatch):
+    """Pool usage is logged once every POOL_SAMPLE_INTERVAL requests."""
+    calls = []
+    monkeypatch.setattr(combined, "log_pool_usage", lambda: calls.append(1))
+    client = _client()
+    for _ in range(combined.POOL_SAMPLE_INTERVAL * 2):
+        client.get("/ping")
+    assert len(calls) == 2
@@ -0,0 +1,73 @@
+"""Tests for the static route dispatcher."""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.main import app as main_app
+from app.utils.routing import StaticRouteDispatcher, build_static_route_index, install_static_route_dispatcher
+
+
+def _app(pattern_first: bool) -> FastAPI:
+    application = FastAPI()
+
+    def pattern(item_id: str):
+        return {"route": "pattern", "item_id": item_id}
+
+    def static():
+        return {"route": "static"}
+
+    routes = [("/items/{item_id}", pattern), ("/items/special", static)]
+    if not pattern_first:
+        routes.reverse()
+    for path, endpoint in routes:
+        application.add_api_route(path, endpoint, methods=["GET"])
+
+    @application.get("/ping")
+    def ping(request: Request):
+        return {"path": request.scope["path"], "root_path": request.scope.get("root_path", "")}
+
+    install_static_route_dispatcher(application.router)
+    return application
+
+
+def test_earlier_pattern_route_wins_over_static():
+    """A static path shadowed by an earlier pattern is left out of the index."""
+    application = _app(pattern_first=True)
+    assert "/items/special" not in build_static_route_index(application.router.routes)
+    response = TestClient(application).get("/items/special")
+    assert response.json() == {"route": "pattern", "item_id": "special"}
+
+
+def test_earlier_static_route_wins_over_pattern():
+    application = _app(pattern_first=False)
+    assert "/items/special" in build_static_route_index(application.router.routes)
+    client = TestClient(application)
+    assert client.get("/items/special").json() == {"route": "static"}
+    assert client.get("/items/other").json() == {"route": "pattern", "item_id": "other"}
+
+
+def test_method_mismatch_falls_back_to_405():
+    """A static path hit with the wrong method gets the router's normal 405."""
+    response = TestClient(_app(pattern_first=False)).post("/ping")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET"
+
+
+def test_unknown_path_falls_back_to_404():
+    assert TestClient(_app(pattern_first=False)).get("/missing").status_code == 404
+
+
+def test_root_path_is_handled_like_the_router():
+    """Requests under a root_path resolve to the same routes with or without the prefix."""
+    client = TestClient(_app(pattern_first=False), root_path="/prefix")
+    for path in ("/ping", "/prefix/ping"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.json() == {"path": path, "root_path": "/prefix"}
+    assert client.get("/prefix/items/special").json() == {"route": "static"}
+
+
+def test_dispatcher_installed_on_the_app_router():
+    """The app's router entry point is the dispatcher, wrapping the original stack."""
+    assert isinstance(main_app.router.middleware_stack, StaticRouteDispatcher)
+    assert "/health" in main_app.router.middleware_stack.index
@@ -0,0 +1,84 @@
+"""Tests for the background sync schedulers."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.tasks import crm_scheduler, email_scheduler
+
+
+async def _noop():
+    pass
+
+
+@pytest.mark.asyncio
+async def test_email_scheduler_runs_and_stops_cleanly(monkeypatch):
+    """The loop syncs once, then waits; leaving the block stops it without errors."""
+    calls = []
+
+    async def sync():
+        calls.append(1)
+
+    monkeypatch.setattr(email_scheduler, "sync_all_email_accounts", sync)
+    async with email_scheduler.email_sync_scheduler():
+        await asyncio.sleep(0.01)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_email_loop_waits_for_the_interval(monkeypatch):
+    """Between syncs the loop sleeps for the interval rather than spinning or failing."""
+    calls = []
+
+    async def sync():
+        calls.append(1)
+
+    monkeypatch.setattr(email_scheduler, "sync_all_email_accounts", sync)
+    monkeypatch.setattr(email_scheduler, "SYNC_INTERVAL_SECONDS", 0.01)
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(email_scheduler._email_sync_loop(stop_event))
+    await asyncio.sleep(0.05)
+    stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+    assert 2 <= len(calls) <= 6
+
+
+@pytest.mark.asyncio
+async def test_crm_scheduler_runs_and_stops_cleanly(monkeypatch):
+    calls = []
+
+    async def sync_due():
+        calls.append(1)
+
+    monkeypatch.setattr(crm_scheduler, "_sync_due_integrations", sync_due)
+    async with crm_scheduler.crm_sync_scheduler():
+        await asyncio.sleep(0.01)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("module", "loop_name", "scheduler_name"),
+    [
+        (email_scheduler, "_email_sync_loop", "email_sync_scheduler"),
+        (crm_scheduler, "_crm_sync_loop", "crm_sync_scheduler"),
+    ],
+)
+async def test_crashed_loop_does_not_break_shutdown(monkeypatch, module, loop_name, scheduler_name):
+    """A loop that died with an error is logged, not re-raised, when the block exits."""
+    async def crash(stop_event):
+        raise RuntimeError("loop crashed")
+
+    monkeypatch.setattr(module, loop_name, crash)
+    async with getattr(module, scheduler_name)():
+        await asyncio.sleep(0)
+
+
+def test_app_lifespan_shutdown_is_clean(monkeypatch):
+    """Leaving the app's lifespan stops both schedulers without raising."""
+    monkeypatch.setattr(email_scheduler, "sync_all_email_accounts", _noop)
+    monkeypatch.setattr(crm_scheduler, "_sync_due_integrations", _noop)
+    with TestClient(app) as client:
+        assert client.get("/health/live").status_code == 200
@@ -0,0 +1,84 @@
+"""Tests for CSV upload insertion."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.api.routes import upload
+
+
+def _rows(*emails):
+    return [
+        {
+            "id": uuid4(),
+            "name": f"Lead {row}",
+            "email": email,
+            "phone": None,
+            "source": "csv_upload",
+            "location": None,
+            "created_by": uuid4(),
+            "_metadata": {"upload_source": "csv", "original_row": row},
+            "row": row,
+        }
+        for row, email in enumerate(emails, start=2)
+    ]
+
+
+def _session(dialect):
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = dialect
+    return db
+
+
+def _fail_flush_for(db, bad_email):
+    """Make ``db.flush()`` raise when the lead just added has ``bad_email``."""
+    def flush():
+        lead = db.add.call_args.args[0]
+        if lead.email == bad_email:
+            raise ValueError("value too long for type character varying(255)")
+    db.flush.side_effect = flush
+
+
+def test_insert_leads_copy_success(monkeypatch):
+    """A clean batch on PostgreSQL goes through a single COPY."""
+    copied = []
+    monkeypatch.setattr(upload, "_copy_leads", lambda db, leads: copied.extend(leads))
+    db = _session("postgresql")
+    leads = _rows("a@example.com", "b@example.com")
+
+    inserted, errors = upload._insert_leads(db, leads)
+
+    assert inserted == leads
+    assert errors == []
+    assert copied == leads
+    db.add.assert_not_called()
+
+
+def test_insert_leads_copy_failure_reports_rows(monkeypatch, caplog):
+    """A rejected COPY is retried per row, keeping valid rows and reporting the bad one."""
+    def failing_copy(db, leads):
+        raise ValueError("COPY rejected the batch")
+
+    monkeypatch.setattr(upload, "_copy_leads", failing_copy)
+    db = _session("postgresql")
+    _fail_flush_for(db, "bad@example.com")
+    leads = _rows("a@example.com", "bad@example.com", "c@example.com")
+
+    inserted, errors = upload._insert_leads(db, leads)
+
+    assert [lead["email"] for lead in inserted] == ["a@example.com", "c@example.com"]
+    assert errors == [{"row": 3, "error": "value too long for type character varying(255)"}]
+    assert db.begin_nested.call_count == 4  # One for the COPY, one per row
+    assert "COPY of 3 uploaded leads failed" in caplog.text
+    assert "COPY rejected the batch" in caplog.text
+
+
+def test_insert_leads_other_dialect_is_per_row():
+    """Non-PostgreSQL databases use the per-row path directly."""
+    db = _session("sqlite")
+    _fail_flush_for(db, "bad@example.com")
+    leads = _rows("bad@example.com", "b@example.com")
+
+    inserted, errors = upload._insert_leads(db, leads)
+
+    assert [lead["email"] for lead in inserted] == ["b@example.com"]
+    assert [error["row"] for error in errors] == [2]